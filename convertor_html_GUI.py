@@ -6,30 +6,72 @@ file selection, and batch processing orchestration.
 
 Architectural Note:
     This class uses Dependency Injection for the conversion logic. The `converter_callback`
-    is passed into `__init__` to avoid circular imports with the main application module.
+    (and the optional `index_callback` and `batch_callback`) are passed into `__init__` to avoid
+    circular imports with the main application module. The converters run in worker processes,
+    so they must be picklable module-level functions.
 """
 
+import itertools
+import math
+import multiprocessing
 import os
+import queue
 import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from typing import Any, Callable, Dict, List, Optional, Tuple
-
-# Type alias for the conversion function: (input_path, output_folder, input_root) -> (success, message)
-ConverterCallback = Callable[[str, Optional[str], Optional[str]], Tuple[bool, str]]
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from operator import itemgetter
+from tkinter import ttk  # filedialog/messagebox are imported where used, keeping them off the startup path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Type alias for the conversion function: (input_path, output_folder, input_root, force, write_index) -> (success, message)
+ConverterCallback = Callable[[str, Optional[str], Optional[str], bool, bool], Tuple[bool, str]]
+# Type alias for the multi-file converter: (input_paths, output_folder, input_root, force) -> [(success, message), ...]
+BatchConverterCallback = Callable[[List[str], Optional[str], Optional[str], bool], List[Tuple[bool, str]]]
+# Type alias for the overview writer: (input_folder, output_folder) -> overview_path
+IndexCallback = Callable[[str, str], str]
+# Type alias for a scanned log: (file_path, file_name, folder names relative to the scanned root)
+ScannedFile = Tuple[str, str, Tuple[str, ...]]
+
+STATUS_DRAIN_INTERVAL_MS = 50  # Period of the Tk-thread timer that applies queued status updates
+STATUS_DRAIN_LIMIT = 256       # Most status updates applied per timer tick
+STATUS_QUEUE_SIZE = 1024       # Pending status updates before the worker thread blocks
+BATCH_DONE_ITEM = ""           # Status-queue item ID (the tree root, never a file row) whose text is the batch summary
+SCAN_BATCH_SIZE = 200          # Paths handed from the scan thread to the Tk thread per queue item
+SCAN_WORKERS = 16              # Directory reads kept in flight while scanning a folder tree
+SCAN_DRAIN_DELAY_MS = 50       # Interval at which the Tk thread inserts newly scanned files
+TREE_EVICT_MIN_FILES = 500     # Collapsing a folder with at least this many file rows releases them
+TREE_ROW_HEIGHT = 22           # Fixed row height, so Tk does not measure every inserted row (recompute if the Treeview font changes)
+
+# Checkbox icons, drawn once per state; toggling an item only swaps the row's image, its text never changes
+CHECKBOX_STATES = ("checked", "partial", "unchecked")
+CHECKBOX_SIZE = 13             # Icon edge length in pixels
+CHECKBOX_BORDER_COLOR = "#6b7280"
+CHECKBOX_FILL_COLOR = "#ffffff"
+CHECKBOX_MARK_COLOR = "#2563eb"
 
 
 class BatchConverterGUI:
     """Tkinter GUI for batch conversion of JSONL log files."""
 
-    def __init__(self, converter_callback: ConverterCallback, root: tk.Tk) -> None:
+    def __init__(
+        self,
+        converter_callback: ConverterCallback,
+        root: tk.Tk,
+        index_callback: Optional[IndexCallback] = None,
+        batch_callback: Optional[BatchConverterCallback] = None,
+    ) -> None:
         """Initialize the main window, layout, and widgets.
 
         Args:
             converter_callback: The function to call for converting a single file.
             root: The root Tkinter window instance.
+            index_callback: Optional function that rewrites the overview page once a batch is finished.
+            batch_callback: Optional function converting several files of one folder per call;
+                used instead of converter_callback when given.
         """
         self.converter_callback = converter_callback
+        self.index_callback = index_callback
+        self.batch_callback = batch_callback
         self.root = root
         
         # --- Window Configuration ---
@@ -44,7 +86,17 @@ class BatchConverterGUI:
         self.output_folder_path = tk.StringVar()
         self.output_folder_custom = False  # Track if user manually set output
         self.check_all_var = tk.BooleanVar(value=True)
+        self.force_rebuild_var = tk.BooleanVar(value=False)  # Reconvert even if the transcript is up to date
         self.tree_items: Dict[str, Dict[str, Any]] = {}
+        self._pending_children: Dict[str, List[ScannedFile]] = {}  # dir item ID -> files not inserted until the dir is expanded
+        self._total_files = 0    # All scanned files, inserted or pending
+        self._checked_files = 0  # Of those, how many are checked
+        self._checked_file_ids: Set[str] = set()  # Inserted file rows that are checked
+        self._scan_cache: Dict[str, Tuple[Dict[str, int], List[ScannedFile]]] = {}  # folder -> ({dir: st_mtime_ns}, sorted files)
+        self._scan_thread: Optional[threading.Thread] = None
+        self._scan_queue: "queue.Queue[Optional[List[ScannedFile]]]" = queue.Queue()  # Replaced on every load; None marks the end
+        # (item_id, status) filled by the worker thread; bounded, so a flood of updates waits for the Tk thread
+        self._status_queue: "queue.Queue[Tuple[str, str]]" = queue.Queue(maxsize=STATUS_QUEUE_SIZE)
 
         # --- UI: Input Folder Selection (Row 0) ---
         input_frame = ttk.Frame(root, padding="10")
@@ -72,6 +124,7 @@ class BatchConverterGUI:
         list_frame = ttk.Frame(root, padding="10")
         list_frame.grid(row=2, column=0, sticky="nsew")
         
+        ttk.Style(root).configure("Treeview", rowheight=TREE_ROW_HEIGHT)
         self.tree = ttk.Treeview(
             list_frame, 
             columns=("status",), 
@@ -80,9 +133,17 @@ class BatchConverterGUI:
         )
         self.tree.heading("#0", text="Name", anchor="w")
         self.tree.heading("status", text="Status", anchor="w")
-        self.tree.column("#0", width=400)
+        self.tree.column("#0", width=400)  # Left stretchable: the only column that absorbs window resizes
         self.tree.column("status", width=120, anchor="w", stretch=False)
 
+        # Hot paths talk to the Tcl treeview command directly, skipping ttk's option marshaling
+        self._tk_call = self.tree.tk.call
+        self._tree_w = str(self.tree)
+
+        # The PhotoImage objects must stay referenced; rows refer to them by their Tcl image name
+        self._checkbox_images = self._create_checkbox_images()
+        self._checkbox_image_names = {state: str(image) for state, image in self._checkbox_images.items()}
+
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscroll=scrollbar.set)
         
@@ -92,6 +153,8 @@ class BatchConverterGUI:
         # Bind events for checkbox toggling
         self.tree.bind("<Double-1>", self.toggle_check)
         self.tree.bind("<space>", self.toggle_check)
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+        self.tree.bind("<<TreeviewClose>>", self._on_close)
 
         # --- UI: Action Buttons (Row 3) ---
         btn_frame = ttk.Frame(root, padding="10")
@@ -103,6 +166,15 @@ class BatchConverterGUI:
             variable=self.check_all_var, 
             command=self.toggle_all
         ).pack(side=tk.LEFT)
+
+        self.scan_label = ttk.Label(btn_frame, text="")
+        self.scan_label.pack(side=tk.LEFT, padx=10)
+
+        ttk.Checkbutton(
+            btn_frame, 
+            text="Force rebuild", 
+            variable=self.force_rebuild_var
+        ).pack(side=tk.LEFT, padx=10)
         
         ttk.Button(
             btn_frame, 
@@ -110,12 +182,16 @@ class BatchConverterGUI:
             command=self.start_batch
         ).pack(side=tk.RIGHT)
 
+        # Status updates from worker threads are applied by this self-rescheduling timer
+        self.root.after(STATUS_DRAIN_INTERVAL_MS, self._drain_status_queue)
+
     # ==========================================
     # Folder Selection Logic
     # ==========================================
 
     def browse_folder(self) -> None:
         """Prompt for a folder and load its JSONL files into the list."""
+        from tkinter import filedialog
         folder = filedialog.askdirectory()
         if folder:
             self.folder_path.set(folder)
@@ -135,6 +211,7 @@ class BatchConverterGUI:
 
     def browse_output_folder(self) -> None:
         """Prompt for an output folder."""
+        from tkinter import filedialog
         folder = filedialog.askdirectory()
         if folder:
             self.output_folder_path.set(folder)
@@ -149,129 +226,390 @@ class BatchConverterGUI:
     # TreeView & File Management
     # ==========================================
 
-    def _find_jsonl_files(self, folder: str) -> List[str]:
-        """Recursively find all .jsonl files in the given folder."""
-        results = []
-        for dirpath, _, filenames in os.walk(folder):
-            for filename in filenames:
-                if filename.lower().endswith(".jsonl"):
-                    results.append(os.path.join(dirpath, filename))
-        return sorted(results)
+    def _find_jsonl_files(self, folder: str) -> List[ScannedFile]:
+        """Recursively find all .jsonl files in the given folder, sorted by path.
+
+        Each result carries the file name and the relative folder names, which
+        the walk already knows, so loading the tree needs no path splitting.
+        Results are cached per folder together with the mtime of every scanned
+        directory; a repeated load only re-stats those directories and skips
+        the walk when none of them has changed.
+        """
+        cached = self._scan_cache.get(folder)
+        if cached and self._scan_is_current(cached[0]):
+            return cached[1]
+
+        # 1. Read all directories concurrently; each finished folder submits its subfolders,
+        # so several readdir calls are in flight at once on slow or networked filesystems
+        listings: Dict[str, List[Tuple[str, str, bool]]] = {}
+        dir_mtimes: Dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            in_flight = {executor.submit(self._read_directory, folder): folder}
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = in_flight.pop(future)
+                    listing = future.result()
+                    if listing is None:
+                        continue  # Unreadable subfolder, skipped like os.walk does
+                    dir_mtimes[path], listings[path] = listing
+                    for _, entry_path, is_dir in listing[1]:
+                        if is_dir:
+                            in_flight[executor.submit(self._read_directory, entry_path)] = entry_path
+
+        # 2. Depth-first pass over the collected listings (no I/O); each stack entry is
+        # (path, rel_parts, file_name), file_name being None for folders
+        results: List[ScannedFile] = []
+        pending: List[Tuple[str, Tuple[str, ...], Optional[str]]] = [(folder, (), None)]
+        while pending:
+            current, rel_parts, file_name = pending.pop()
+            if file_name is not None:
+                results.append((current, file_name, rel_parts))
+                continue
+
+            children = []
+            for name, entry_path, is_dir in listings.get(current, ()):
+                if is_dir:
+                    # A folder sorts by its trailing separator, exactly where its files fall in a full-path sort
+                    children.append((name + os.sep, (entry_path, rel_parts + (name,), None)))
+                else:
+                    children.append((name, (entry_path, rel_parts, name)))
+
+            # Sorting per folder yields the global path order without one big sort at the end
+            children.sort(key=lambda child: child[0], reverse=True)
+            pending.extend(child for _, child in children)
+
+        if folder in dir_mtimes:  # An unreadable root is not cached, so it is retried next time
+            self._scan_cache[folder] = (dir_mtimes, results)
+        return results
+
+    @staticmethod
+    def _read_directory(path: str) -> Optional[Tuple[int, List[Tuple[str, str, bool]]]]:
+        """Read one directory for the scan: its mtime and its (name, path, is_dir) entries.
+
+        Only subfolders and .jsonl files are listed. Returns None if the
+        directory cannot be read.
+        """
+        entries = []
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            # DirEntry carries the joined path and cached file type
+            with os.scandir(path) as scanned:
+                for entry in scanned:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((name, entry.path, True))
+                    elif entry.is_file():
+                        if name.endswith((".jsonl", ".JSONL")) or name[-6:].lower() == ".jsonl":  # Only the suffix is lowercased
+                            entries.append((name, entry.path, False))
+        except OSError:
+            return None
+        return mtime, entries
+
+    @staticmethod
+    def _scan_is_current(dir_mtimes: Dict[str, int]) -> bool:
+        """Return True if none of the previously scanned directories changed."""
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+        except OSError:
+            return False
 
     def load_files(self, folder: str) -> None:
-        """Clear the tree and populate it with JSONL files found in the folder."""
+        """Clear the tree and start populating it with JSONL files found in the folder."""
         # Clear existing items
         for item in self.tree.get_children():
             self.tree.delete(item)
         self.tree_items = {}
-
-        if not os.path.exists(folder):
-            return
-
-        jsonl_files = self._find_jsonl_files(folder)
-        if not jsonl_files:
-            return
-
-        # Reconstruct tree hierarchy
-        dir_items: Dict[str, str] = {}
-        for file_path in jsonl_files:
-            rel_dir = os.path.relpath(os.path.dirname(file_path), folder)
-            parent_id = self._ensure_dir_item(dir_items, folder, rel_dir)
-            self._add_file_item(parent_id, file_path)
-
-    def _ensure_dir_item(self, dir_items: Dict[str, str], root_folder: str, rel_dir: str) -> str:
+        self._pending_children = {}
+        self._total_files = 0
+        self._checked_files = 0
+        self._checked_file_ids = set()
+
+        # A fresh queue detaches any scan still running for a previously loaded folder
+        scan_queue: "queue.Queue[Optional[List[ScannedFile]]]" = queue.Queue()
+        self._scan_queue = scan_queue
+
+        # Scan in the background (a missing folder simply yields no files) so the Tk main loop keeps running; rows are inserted as batches arrive
+        self.scan_label.configure(text="Scanning...")
+        self._scan_thread = threading.Thread(target=self._scan_worker, args=(folder, scan_queue), daemon=True)
+        self._scan_thread.start()
+        self.root.after(SCAN_DRAIN_DELAY_MS, self._drain_scan_queue, scan_queue, folder, {})
+
+    def _scan_worker(self, folder: str, scan_queue: "queue.Queue[Optional[List[ScannedFile]]]") -> None:
+        """Find JSONL files off the Tk thread and post them in batches, followed by None."""
+        try:
+            jsonl_files = self._find_jsonl_files(folder)
+            for start in range(0, len(jsonl_files), SCAN_BATCH_SIZE):
+                scan_queue.put(jsonl_files[start:start + SCAN_BATCH_SIZE])
+        finally:
+            scan_queue.put(None)
+
+    def _drain_scan_queue(
+        self,
+        scan_queue: "queue.Queue[Optional[List[ScannedFile]]]",
+        folder: str,
+        dir_items: Dict[Tuple[str, ...], str],
+    ) -> None:
+        """Insert scanned files into the tree on the Tk thread, rescheduling until the scan ends."""
+        if scan_queue is not self._scan_queue:
+            return  # Superseded by a newer load_files call
+
+        while True:
+            try:
+                batch = scan_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(SCAN_DRAIN_DELAY_MS, self._drain_scan_queue, scan_queue, folder, dir_items)
+                return
+            if batch is None:
+                self.scan_label.configure(text="")
+                return
+
+            # Reconstruct tree hierarchy; files inside folders wait until the folder is expanded.
+            # The scan is path-ordered, so files of one folder arrive as a run and are handled together.
+            for rel_parts, run in itertools.groupby(batch, key=itemgetter(2)):
+                files = list(run)
+                parent_id = self._ensure_dir_item(dir_items, folder, rel_parts)
+                self._total_files += len(files)
+                if not parent_id:
+                    self._checked_files += len(files)
+                    self._add_file_items(parent_id, (("end", file_path, file_name) for file_path, file_name, _ in files))
+                    continue
+
+                parent = self.tree_items[parent_id]
+                if parent["pending_state"] == "checked":
+                    self._checked_files += len(files)
+                if parent_id in self._pending_children:
+                    self._pending_children[parent_id].extend(files)
+                else:
+                    self._pending_children[parent_id] = files
+                    parent["placeholder"] = self.tree.insert(
+                        parent_id, "end", text="\u2026", values=("",)  # Placeholder so the folder can be expanded
+                    )
+
+    def _ensure_dir_item(
+        self,
+        dir_items: Dict[Tuple[str, ...], str],
+        root_folder: str,
+        rel_parts: Tuple[str, ...],
+    ) -> str:
         """Ensure directory nodes exist in the tree; returns the ID of the immediate parent."""
-        if rel_dir == ".":
+        if not rel_parts:
             return ""  # Root level
+        if rel_parts in dir_items:
+            return dir_items[rel_parts]  # Usual case: the folder already exists
 
-        current_rel = ""
         parent_id = ""
         
         # Build path segment by segment
-        for part in rel_dir.split(os.sep):
-            current_rel = part if not current_rel else os.path.join(current_rel, part)
+        for depth, part in enumerate(rel_parts, 1):
+            current_rel = rel_parts[:depth]
             
             if current_rel not in dir_items:
-                dir_id = self.tree.insert(
-                    parent_id,
-                    "end",
-                    text=self._format_item_label(part, "checked"),
-                    values=("",),
-                    open=True,
+                dir_id = self._tk_call(
+                    self._tree_w, "insert", parent_id, "end",
+                    "-text", part,
+                    "-image", self._checkbox_image_names["checked"],
+                    "-values", ("",),
+                    "-open", False,
                 )
                 dir_items[current_rel] = dir_id
                 self.tree_items[dir_id] = {
-                    "id": dir_id,
                     "name": part,
-                    "path": os.path.join(root_folder, current_rel),
+                    "path": os.path.join(root_folder, *current_rel),
                     "is_dir": True,
                     "state": "checked",
+                    "rel_parts": current_rel,
+                    "pending_state": "checked",  # State given to its files once they are inserted
+                    "parent": parent_id,
+                    "children": [],
+                    "placeholder": "",  # ID of the row shown while the files are pending
                 }
+                if parent_id:
+                    self.tree_items[parent_id]["children"].append(dir_id)
             parent_id = dir_items[current_rel]
             
         return parent_id
 
-    def _add_file_item(self, parent_id: str, file_path: str) -> None:
-        """Add a single file row to the tree."""
-        file_name = os.path.basename(file_path)
-        file_id = self.tree.insert(
-            parent_id,
-            "end",
-            text=self._format_item_label(file_name, "checked"),
-            values=("Waiting...",),
+    def _add_file_items(
+        self,
+        parent_id: str,
+        rows: Iterable[Tuple[Any, str, str]],
+        state: str = "checked",
+    ) -> None:
+        """Add file rows, given as (index, file_path, file_name), under one parent.
+
+        Everything the loop touches per row is bound to a local first, since
+        this runs once per file while a folder is populated.
+        """
+        tk_call = self._tk_call
+        tree_w = self._tree_w
+        image_name = self._checkbox_image_names[state]
+        tree_items = self.tree_items
+        siblings = tree_items[parent_id]["children"] if parent_id else None  # Unordered; the tree keeps the display order
+        checked_file_ids = self._checked_file_ids if state == "checked" else None
+        for index, file_path, file_name in rows:
+            file_id = tk_call(
+                tree_w, "insert", parent_id, index,
+                "-text", file_name,
+                "-image", image_name,
+                "-values", ("Waiting...",),
+            )
+            tree_items[file_id] = {
+                "name": file_name,
+                "path": file_path,
+                "is_dir": False,
+                "state": state,
+                "parent": parent_id,
+            }
+            if siblings is not None:
+                siblings.append(file_id)
+            if checked_file_ids is not None:
+                checked_file_ids.add(file_id)
+
+    def _on_open(self, event: Optional[tk.Event] = None) -> None:
+        """Insert the files of a folder the first time it is expanded."""
+        self._populate_dir(self.tree.focus())
+
+    def _on_close(self, event: Optional[tk.Event] = None) -> None:
+        """Release the file rows of a large folder when it is collapsed."""
+        self._evict_dir_files(self.tree.focus())
+
+    def _evict_dir_files(self, dir_id: str) -> None:
+        """Turn a collapsed folder's file rows back into pending files, keeping Tk's item store small.
+
+        Only done for folders with at least TREE_EVICT_MIN_FILES files that all
+        share one checkbox state and still wait for conversion, since the
+        pending list keeps neither per-file selections nor statuses. Reopening
+        the folder repopulates it from the stored entries without any I/O.
+        """
+        dir_item = self.tree_items.get(dir_id)
+        if not dir_item or not dir_item["is_dir"] or dir_id in self._pending_children:
+            return
+        file_ids = [cid for cid in dir_item["children"] if not self.tree_items[cid]["is_dir"]]
+        if len(file_ids) < TREE_EVICT_MIN_FILES:
+            return
+        states = {self.tree_items[file_id]["state"] for file_id in file_ids}
+        if len(states) != 1 or any(self.tree.set(file_id, "status") != "Waiting..." for file_id in file_ids):
+            return
+
+        rel_parts = dir_item["rel_parts"]
+        pending_files = []
+        for file_id in file_ids:
+            file_item = self.tree_items.pop(file_id)
+            pending_files.append((file_item["path"], file_item["name"], rel_parts))
+            self._checked_file_ids.discard(file_id)
+        self.tree.delete(*file_ids)
+
+        # The folder's state is unchanged: its files are now represented by pending_state
+        dir_item["children"] = [cid for cid in dir_item["children"] if cid in self.tree_items]
+        dir_item["pending_state"] = states.pop()
+        self._pending_children[dir_id] = pending_files
+        dir_item["placeholder"] = self.tree.insert(dir_id, "end", text="\u2026", values=("",))
+
+    def _populate_dir(self, dir_id: str) -> None:
+        """Replace a folder's placeholder row with its pending file rows."""
+        pending_files = self._pending_children.pop(dir_id, None)
+        if pending_files is None:
+            return
+
+        dir_item = self.tree_items[dir_id]
+        self.tree.delete(dir_item["placeholder"])
+        dir_item["placeholder"] = ""
+
+        # Files and subfolders are merged by path, reproducing the sorted scan order
+        # (a subfolder sorts by its trailing separator, like the paths of its files)
+        entries = sorted(
+            [(self.tree_items[cid]["path"] + os.sep, "") for cid in dir_item["children"]]
+            + [(file_path, file_name) for file_path, file_name, _ in pending_files]
+        )
+        self._add_file_items(
+            dir_id,
+            ((index, file_path, file_name) for index, (file_path, file_name) in enumerate(entries) if file_name),
+            dir_item["pending_state"],
         )
-        self.tree_items[file_id] = {
-            "id": file_id,
-            "name": file_name,
-            "path": file_path,
-            "is_dir": False,
-            "state": "checked",
-        }
 
     # ==========================================
     # Checkbox & State Logic
     # ==========================================
 
-    def _format_item_label(self, name: str, state: str) -> str:
-        """Return label text prefixed with a visual checkbox state."""
-        markers = {"checked": "[x]", "partial": "[-]", "unchecked": "[ ]"}
-        return f"{markers.get(state, '[ ]')}  {name}"
+    def _create_checkbox_images(self) -> Dict[str, tk.PhotoImage]:
+        """Draw one small checkbox icon per item state."""
+        size = CHECKBOX_SIZE
+        images = {}
+        for state in CHECKBOX_STATES:
+            image = tk.PhotoImage(master=self.root, width=size, height=size)
+            image.put(CHECKBOX_BORDER_COLOR, to=(0, 0, size, size))
+            image.put(CHECKBOX_FILL_COLOR, to=(1, 1, size - 1, size - 1))
+            if state == "checked":
+                image.put(CHECKBOX_MARK_COLOR, to=(3, 3, size - 3, size - 3))
+            elif state == "partial":
+                image.put(CHECKBOX_MARK_COLOR, to=(3, size // 2 - 1, size - 3, size // 2 + 2))
+            images[state] = image
+        return images
 
     def _update_item_label(self, item_id: str) -> None:
-        """Refresh the visual label and status column for a tree item."""
-        item = self.tree_items[item_id]
-        current_values = self.tree.item(item_id, "values")
-        # Preserve existing status text
-        current_status = current_values[0] if current_values else ""
-        
-        self.tree.item(
-            item_id,
-            text=self._format_item_label(item["name"], item["state"]),
-            values=(current_status,),
-        )
+        """Refresh the checkbox icon of a tree item.
 
-    def _set_item_state(self, item_id: str, state: str, cascade: bool = False) -> None:
-        """Recursively set the checked state of an item and its children."""
-        item = self.tree_items.get(item_id)
-        if not item:
-            return
-            
-        item["state"] = state
-        self._update_item_label(item_id)
-        
-        if cascade and item["is_dir"]:
-            for child_id in self.tree.get_children(item_id):
-                self._set_item_state(child_id, state, cascade=True)
+        Only the image is swapped; the text and the status column are left
+        untouched, so Tk does not re-layout the row text.
+        """
+        self._tk_call(self._tree_w, "item", item_id, "-image", self._checkbox_image_names[self.tree_items[item_id]["state"]])
+
+    def _set_item_state(self, item_id: str, state: str, cascade: bool = False) -> bool:
+        """Set the checked state of an item and, with cascade, of all its descendants.
+
+        The subtree is walked with an explicit stack rather than recursion,
+        with the lookups used per node bound to locals up front.
+
+        Returns:
+            True if the state of any item actually changed.
+        """
+        tree_items = self.tree_items
+        pending_children = self._pending_children
+        update_label = self._update_item_label
+        changed = False
+        stack = [item_id]
+        push_children = stack.extend
+        while stack:
+            current_id = stack.pop()
+            item = tree_items[current_id]
+            if item["state"] != state:  # Unchanged items keep their icon; the cascade still descends below
+                changed = True
+                if not item["is_dir"]:
+                    # Keep the running selection counters in step with file transitions
+                    if state == "checked":
+                        self._checked_files += 1
+                        self._checked_file_ids.add(current_id)
+                    else:
+                        self._checked_files -= 1
+                        self._checked_file_ids.discard(current_id)
+                item["state"] = state
+                update_label(current_id)
+
+            if cascade and item["is_dir"]:
+                if item["pending_state"] != state and current_id in pending_children:
+                    pending_count = len(pending_children[current_id])
+                    self._checked_files += pending_count if state == "checked" else -pending_count
+                item["pending_state"] = state
+                push_children(item["children"])
+
+        return changed
 
     def _update_parent_states(self, item_id: str) -> None:
-        """Walk up the tree to update parent directory states based on children."""
-        parent_id = self.tree.parent(item_id)
+        """Walk up the tree to update parent directory states based on children.
+
+        Parent and child IDs come from the cached tree_items entries, so the walk
+        needs no Tcl round-trips.
+        """
+        tree_items = self.tree_items
+        parent_id = tree_items[item_id]["parent"]
         while parent_id:
-            child_ids = self.tree.get_children(parent_id)
-            if not child_ids:
+            parent = tree_items[parent_id]
+            states = [tree_items[cid]["state"] for cid in parent["children"]]
+            if parent_id in self._pending_children:
+                states.append(parent["pending_state"])
+            if not states:
                 break
-                
-            states = [self.tree_items[cid]["state"] for cid in child_ids]
             
             if all(s == "checked" for s in states):
                 new_state = "checked"
@@ -280,12 +618,13 @@ class BatchConverterGUI:
             else:
                 new_state = "partial"
                 
-            # Only update if changed
-            if self.tree_items[parent_id]["state"] != new_state:
-                self.tree_items[parent_id]["state"] = new_state
-                self._update_item_label(parent_id)
+            # An unchanged parent leaves every ancestor above it unchanged as well
+            if parent["state"] == new_state:
+                break
+            parent["state"] = new_state
+            self._update_item_label(parent_id)
                 
-            parent_id = self.tree.parent(parent_id)
+            parent_id = parent["parent"]
 
     def toggle_check(self, event: Optional[tk.Event] = None) -> None:
         """Toggle the selection state of the currently focused item."""
@@ -299,20 +638,36 @@ class BatchConverterGUI:
             
         new_state = "unchecked" if item["state"] == "checked" else "checked"
         
-        self._set_item_state(selected_id, new_state, cascade=True)
+        if not self._set_item_state(selected_id, new_state, cascade=True):
+            return  # Nothing changed, so neither the parents nor "Select All" can have
         self._update_parent_states(selected_id)
         
         # Sync "Select All" checkbox if necessary
-        file_states = [i["state"] for i in self.tree_items.values() if not i["is_dir"]]
-        all_checked = bool(file_states) and all(s == "checked" for s in file_states)
+        all_checked = self._total_files > 0 and self._checked_files == self._total_files
         if self.check_all_var.get() != all_checked:
             self.check_all_var.set(all_checked)
 
     def toggle_all(self) -> None:
         """Select or deselect all items based on the master checkbox."""
         target_state = "checked" if self.check_all_var.get() else "unchecked"
-        for item_id in self.tree.get_children(""):
-            self._set_item_state(item_id, target_state, cascade=True)
+        target_image = self._checkbox_image_names[target_state]
+        checked_file_ids = set()
+
+        # Every item ends up in the same state, so one flat pass replaces the cascade and the parent walk
+        for item_id, item in self.tree_items.items():
+            item["state"] = target_state
+            if item["is_dir"]:
+                item["pending_state"] = target_state
+            else:
+                checked_file_ids.add(item_id)
+            self._tk_call(self._tree_w, "item", item_id, "-image", target_image)
+
+        if target_state == "checked":
+            self._checked_files = self._total_files
+            self._checked_file_ids = checked_file_ids
+        else:
+            self._checked_files = 0
+            self._checked_file_ids = set()
 
     # ==========================================
     # Batch Processing
@@ -320,44 +675,133 @@ class BatchConverterGUI:
 
     def start_batch(self) -> None:
         """Identify selected files and start the conversion thread."""
-        to_process = [
-            item for item in self.tree_items.values()
-            if not item["is_dir"] and item["state"] == "checked"
-        ]
+        # Collapsed folders with selected files get their rows now, so every file has a status cell
+        for dir_id in [d for d in self._pending_children if self.tree_items[d]["pending_state"] == "checked"]:
+            self._populate_dir(dir_id)
+
+        # The checked set is unordered; sorting by path restores the scan (and tree) order
+        to_process = sorted(
+            ((file_id, self.tree_items[file_id]["path"]) for file_id in self._checked_file_ids),
+            key=itemgetter(1),
+        )
         
         if not to_process:
+            from tkinter import messagebox
             messagebox.showwarning("No Files", "No files selected for conversion.")
             return
             
-        # Run processing in a separate thread to keep UI responsive
-        threading.Thread(target=self.process_files, args=(to_process,), daemon=True).start()
-
-    def process_files(self, files: List[Dict[str, Any]]) -> None:
-        """Iterate through files and trigger the injected converter callback."""
+        # Run processing in a separate thread to keep UI responsive (Tk variables are read here, on the Tk thread)
         input_root = self.folder_path.get().strip()
         output_folder = self.output_folder_path.get().strip() or input_root
+        force = self.force_rebuild_var.get()
+        threading.Thread(
+            target=self.process_files, args=(to_process, input_root, output_folder, force), daemon=True
+        ).start()
 
-        for item in files:
-            self.update_status(item["id"], "Converting...")
+    def process_files(self, files: List[Tuple[str, str]], input_root: str, output_folder: str, force: bool = False) -> None:
+        """Convert (item_id, path) pairs in parallel worker processes via the injected converter callback.
+
+        Runs on a helper thread: it makes no Tk calls, and every status
+        update, including the final summary, goes through the status queue.
+        """
 
+        # Each conversion is independent and CPU-bound, so worker processes sidestep the GIL;
+        # a small batch does not need more processes than it has files.
+        # Workers are spawned, never forked: this runs on a helper thread of the Tk process.
+        max_workers = min(len(files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
             # --- DEPENDENCY INJECTION CALL ---
-            # Using the callback passed in __init__
-            success, _msg = self.converter_callback(item["path"], output_folder, input_root)
-            
-            final_status = "Done" if success else "Error"
-            self.update_status(item["id"], final_status)
+            # Using the callbacks passed in __init__; each future maps to the files it converts
+            if self.batch_callback:
+                chunk_size = math.ceil(len(files) / max_workers)  # Keeps every worker busy even if one folder holds everything
+                futures = {
+                    executor.submit(self.batch_callback, [path for _, path in group], output_folder, input_root, force): group
+                    for group in self._group_by_folder(files, chunk_size)
+                }
+            else:
+                # With an index callback the overview is written once below, not by every worker
+                write_index = self.index_callback is None
+                futures = {
+                    executor.submit(self.converter_callback, path, output_folder, input_root, force, write_index): [(item_id, path)]
+                    for item_id, path in files
+                }
 
-        # Notify user on the main thread
-        self.root.after(0, lambda: messagebox.showinfo("Batch Complete", f"Finished processing {len(files)} files."))
+            # Marked after submitting: the bounded status queue may block here, but the workers already run
+            for item_id, _ in files:
+                self.update_status(item_id, "Converting...")
+
+            for future in as_completed(futures):
+                group = futures[future]
+                try:
+                    results = future.result() if self.batch_callback else [future.result()]
+                except Exception:
+                    results = [(False, "")] * len(group)
+
+                for (item_id, _), (success, msg) in zip(group, results):
+                    final_status = msg if success else "Error"  # "Done" or "Cached"
+                    self.update_status(item_id, final_status)
+
+        summary = f"Finished processing {len(files)} files."
+
+        # Workers finish in any order, so the overview is rebuilt once everything is written
+        if self.index_callback and os.path.isdir(output_folder):
+            try:
+                self.index_callback(input_root, output_folder)
+            except Exception as e:
+                summary += f"\nThe overview page could not be written: {e}"
+
+        # Shown by _drain_status_queue once the statuses queued before it are applied
+        self.update_status(BATCH_DONE_ITEM, summary)
+
+    @staticmethod
+    def _group_by_folder(files: List[Tuple[str, str]], chunk_size: int) -> List[List[Tuple[str, str]]]:
+        """Group (item_id, path) pairs by their folder, splitting groups larger than chunk_size."""
+        def folder_of(file: Tuple[str, str]) -> str:
+            return os.path.dirname(file[1])
+
+        groups = []
+        for _, folder_items in itertools.groupby(sorted(files, key=folder_of), key=folder_of):
+            folder_items = list(folder_items)
+            for start in range(0, len(folder_items), chunk_size):
+                groups.append(folder_items[start:start + chunk_size])
+        return groups
 
     def update_status(self, item_id: str, status_text: str) -> None:
-        """Safely update the treeview status from a background thread."""
-        self.root.after(0, lambda: self._internal_update_status(item_id, status_text))
+        """Queue a treeview status update from a background thread.
+
+        Only the queue is touched here; no Tk call is made from the worker
+        thread. The updates are applied by _drain_status_queue. Blocks while
+        the queue is full, so it must not be called on the Tk thread itself.
+        """
+        self._status_queue.put((item_id, status_text))
+
+    def _drain_status_queue(self) -> None:
+        """Apply up to STATUS_DRAIN_LIMIT queued status updates on the Tk thread, then reschedule.
+
+        The limit bounds the Tcl work done per tick, so a large batch cannot
+        stall redraws; the rest waits in the queue for the next tick. A
+        BATCH_DONE_ITEM entry ends the tick and shows its text as the batch summary.
+        """
+        summary = None
+        for _ in range(STATUS_DRAIN_LIMIT):
+            try:
+                item_id, status_text = self._status_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item_id == BATCH_DONE_ITEM:
+                summary = status_text
+                break
+            self._internal_update_status(item_id, status_text)
+        self.root.after(STATUS_DRAIN_INTERVAL_MS, self._drain_status_queue)
+
+        if summary is not None:
+            from tkinter import messagebox
+            messagebox.showinfo("Batch Complete", summary)
 
     def _internal_update_status(self, item_id: str, status_text: str) -> None:
         """Internal UI update helper."""
         try:
-            self.tree.item(item_id, values=(status_text,))
+            self._tk_call(self._tree_w, "item", item_id, "-values", (status_text,))
         except tk.TclError:
             # Window might have been closed during processing
             pass
\ No newline at end of file
@@ -33,31 +33,58 @@ Log structure notes:
 
 import html
 import json
+import mmap
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 import tkinter as tk
 
 import traceback
 
+try:
+    import orjson
+    _json_loads = orjson.loads   # Optional, parses the raw UTF-8 bytes of each line several times faster
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _ciso_parse   # Optional C parser for ISO 8601, handles "Z" and fractions natively
+except ImportError:
+    _ciso_parse = None
+
 from convertor_html_GUI import BatchConverterGUI
 
 from convertor_html_rendering import (
     ICON_ASSISTANT,
     ICON_GEAR,
     ICON_USER,
+    HTML_FOOTER,
     _build_event_message,
-    _build_index_html,
+    _build_index_html_parts,
     _build_response_item,
     _build_turn_context_message,
-    get_html_footer,
     get_html_header,
 )
 
+# Type alias for the overview metadata of one log: (date_display, timestamp, first prompt)
+SessionHeader = Tuple[str, Optional[datetime], str]
 
 DATE_FORMAT = "%d.%m.%Y %H:%M:%S"
 
+OUTPUT_BUFFER_SIZE = 1 << 20    # 1 MiB write buffer for the streamed transcript
+
+INDEX_CACHE_FILENAME = ".index_cache.json"   # Per-log overview metadata, stored next to the overview page
+
+_EMPTY: Dict[str, Any] = {}    # Shared default for a missing payload; only ever read, never mutated
+
+DT_MIN = datetime.min   # Epoch for the overview sort key
+
+INDEX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)   # I/O-bound, so oversubscribe the cores
+
 # A little robot icon for the window in tkinter
 APP_ICON_PNG_BASE64 = (
     "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAYElEQVR4nGNgwAMCTpz4D8"
@@ -65,6 +92,43 @@ APP_ICON_PNG_BASE64 = (
     "dQ2gOAzQYwHEtrGxQcHo8vRJByQbQFFSHjAAABG9kLrPW+PgAAAAAElFTkSuQmCC"
 )
 
+# Fast path for the "YYYY-MM-DDTHH:MM:SS[.fff][Z]" timestamps Codex writes. Fields are range-checked;
+# days 29-31 and years before 1000 go through the full parser, which checks the calendar.
+ISO_TIMESTAMP_PATTERN = re.compile(
+    r"([1-9][0-9]{3})-(0[1-9]|1[0-2])-(0[1-9]|1[0-9]|2[0-8])"
+    r"[T ]([01][0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9])(?:\.[0-9]+)?Z?\Z"
+)
+
+# Static part of the per-file processing map.
+# Structure: Key -> (Display Name, CSS Class, Icon, Hash Group); keys sharing a group share one dedup hash set
+PROCESSING_MAP_TEMPLATE: Dict[str, Tuple[str, str, str, str]] = {
+    # --- Event Messages (Key = 'type') ---
+    "user_message":  ("User",      "role-user-chat",   ICON_USER,      "user_messages"),        # user chat text messages
+    "agent_message": ("Assistant", "role-assistant",   ICON_ASSISTANT, "assistant_messages"),   # all assistant text
+
+    # --- Response Items (Key = 'role') ---
+    "user":          ("User",      "role-user-log",    ICON_USER,      "user_events"),          # user chat events (contains additional context apart from the user's prompt)
+    "assistant":     ("Assistant", "role-assistant",   ICON_ASSISTANT, "assistant_messages"),
+
+    # --- Fallbacks ---
+    "developer":     ("Developer", "role-developer",   ICON_GEAR,      "events_other"),         # Tool/Dev
+    "default":       ("Developer", "role-developer",   ICON_GEAR,      "events_other"),
+
+    # --- Turn Context ---
+    "turn_context":  ("Model Info", "role-model-info", ICON_GEAR,      "turn_contexts"),        # Turn Context Info, currently not used
+}
+PROCESSING_HASH_GROUPS = frozenset(group for *_, group in PROCESSING_MAP_TEMPLATE.values())
+
+# Injected into the transcript in place of a record that failed to render; filled with the escaped error text
+ERROR_HTML_TEMPLATE = (
+    '<div style="border: 2px solid #ef4444; background: #fef2f2; color: #b91c1c; '
+    'padding: 12px; margin: 16px 0; border-radius: 8px; font-family: monospace;">'
+    '<strong>Conversion Error:</strong> {}'
+    '</div>'
+)
+
+PATH_NEEDS_HREF_FIX = os.sep != "/"   # Only Windows paths need their separators rewritten for hrefs
+
 REQUEST_SECTION_PATTERN = re.compile(
     r"(?ms)^#+\s*My request for Codex:?\s*(.*?)(?=^#+\s|\Z)"
 )
@@ -74,25 +138,32 @@ REQUEST_SECTION_PATTERN = re.compile(
 # ==========================================
 
 
-def _normalize_iso_timestamp(iso_str: str) -> str:
-    """Normalize ISO timestamps by removing UTC suffix and fractional seconds."""
-    if not isinstance(iso_str, str):
-        return ""
-    normalized = iso_str.rstrip("Z")                # Getting rid of the 'Zulu' = 'UTC' designation
-    if "." in normalized:
-        normalized = normalized.split(".", 1)[0]    # Getting rid of miliseconds - no value for the user
-    return normalized
-
-
-def _parse_iso_datetime(iso_str: str) -> Optional[datetime]:
-    """Parse an ISO timestamp string into a datetime object."""
-    normalized = _normalize_iso_timestamp(iso_str)
-    if not normalized:
-        return None
-    try:
-        return datetime.fromisoformat(normalized)  # Converts str into a Python object that represents a specific point in time
-    except ValueError:
-        return None
+if _ciso_parse is not None:
+    def _parse_iso_datetime(iso_str: str) -> Optional[datetime]:
+        """Parse an ISO timestamp string into a naive datetime, dropping the UTC suffix and fractional seconds."""
+        try:
+            return _ciso_parse(iso_str).replace(microsecond=0, tzinfo=None)
+        except (TypeError, ValueError):
+            return None
+elif sys.version_info >= (3, 11):
+    def _parse_iso_datetime(iso_str: str) -> Optional[datetime]:
+        """Parse an ISO timestamp string into a naive datetime, dropping the UTC suffix and fractional seconds."""
+        try:
+            # Python 3.11+ accepts the "Z" suffix and any fraction length natively
+            return datetime.fromisoformat(iso_str).replace(microsecond=0, tzinfo=None)
+        except (TypeError, ValueError):
+            return None
+else:
+    def _parse_iso_datetime(iso_str: str) -> Optional[datetime]:
+        """Parse an ISO timestamp string into a naive datetime, dropping the UTC suffix and fractional seconds."""
+        if not isinstance(iso_str, str):
+            return None
+        normalized = iso_str[:-1] if iso_str.endswith("Z") else iso_str  # Getting rid of the 'Zulu' = 'UTC' designation
+        normalized = normalized.partition(".")[0]                           # Getting rid of miliseconds - no value for the user
+        try:
+            return datetime.fromisoformat(normalized)
+        except ValueError:
+            return None
 
 
 def format_timestamp(iso_str: Any) -> Any:
@@ -107,15 +178,19 @@ def format_timestamp(iso_str: Any) -> Any:
     """
     if not isinstance(iso_str, str):
         return iso_str
+    match = ISO_TIMESTAMP_PATTERN.match(iso_str)
+    if match:
+        year, month, day, hour, minute, second = match.groups()
+        return f"{day}.{month}.{year} {hour}:{minute}:{second}"   # Same layout as DATE_FORMAT, without datetime/strftime
     dt = _parse_iso_datetime(iso_str)
     return dt.strftime(DATE_FORMAT) if dt else iso_str
 
 
-def get_session_date(lines: Iterable[str]) -> str:
+def get_session_date(lines: Iterable[Union[str, bytes]]) -> str:
     """Extract the first available timestamp from JSONL lines.
 
     Args:
-        lines: Iterable of JSONL strings.
+        lines: Iterable of JSONL lines (str, or UTF-8 bytes from a mapped file).
 
     Returns:
         Formatted timestamp string or an empty string if none is found.
@@ -124,22 +199,42 @@ def get_session_date(lines: Iterable[str]) -> str:
         data = _parse_json_line(line)
         if not data:
             continue
-        if "timestamp" in data:
-            return format_timestamp(data["timestamp"])
-        payload = data.get("payload", {})
-        if isinstance(payload, dict) and "timestamp" in payload:
-            return format_timestamp(payload["timestamp"])
+        raw_timestamp = _get_record_timestamp(data)
+        if raw_timestamp is not None:
+            return format_timestamp(raw_timestamp)
     return ""
 
 
-def _parse_json_line(line: str) -> Optional[Dict[str, Any]]:
-    """Parse a JSONL line into a dict; return None on errors."""
+def _get_record_timestamp(data: Dict[str, Any]) -> Any:
+    """Return the raw timestamp of a parsed JSONL record (top level first, then payload), or None."""
+    if "timestamp" in data:
+        return data["timestamp"]
+    payload = data.get("payload", _EMPTY)
+    if isinstance(payload, dict):
+        return payload.get("timestamp")
+    return None
+
+
+def _parse_json_line(line: Union[str, bytes], _loads: Callable[[Union[str, bytes]], Any] = _json_loads) -> Optional[Dict[str, Any]]:
+    """Parse a JSONL line (str or UTF-8 bytes) into a dict; return None on decode errors."""
+    try:
+        return _loads(line)     # Bound as a default argument: a fast local lookup on this per-line path
+    except (ValueError, RecursionError):  # orjson.JSONDecodeError subclasses ValueError too; json recurses on deep nesting
+        if _loads is json.loads:
+            return None
+    # orjson rejects NaN/Infinity and lone surrogates that json accepts; let json have the final say
     try:
         return json.loads(line)
-    except Exception:
+    except (ValueError, RecursionError):
         return None
 
 
+def _iter_mapped_lines(mapped: mmap.mmap) -> Iterator[bytes]:
+    """Yield the raw lines of a memory-mapped file, starting from its beginning."""
+    mapped.seek(0)
+    return iter(mapped.readline, b"")
+
+
 def _path_to_href(path: str) -> str:
     """
     Convert a file system path into a relative URL.
@@ -147,41 +242,49 @@ def _path_to_href(path: str) -> str:
     On Windows, os.sep is \\. On Linux/Mac, it is /.
     We need to ensure everything is a forward slash for HTML.
     """
-    return path.replace(os.sep, "/")
+    return path.replace(os.sep, "/") if PATH_NEEDS_HREF_FIX else path
 
 
-def _get_session_timestamp(lines: Iterable[str]) -> Optional[datetime]:
-    """Return the first valid timestamp parsed from JSONL lines."""
-    for line in lines:
-        data = _parse_json_line(line)
-        if not data:
-            continue
-        if "timestamp" in data:
-            ts = _parse_iso_datetime(data["timestamp"])
-            if ts:
-                return ts
-        payload = data.get("payload", {})
-        if isinstance(payload, dict) and "timestamp" in payload:
-            ts = _parse_iso_datetime(payload["timestamp"])
-            if ts:
-                return ts
-    return None
+def _scan_session_header(input_path: str) -> SessionHeader:
+    """Read a JSONL log only as far as needed for its overview entry.
 
+    Every line is parsed once; reading stops as soon as the session date,
+    the first valid timestamp and the first user prompt are all known.
 
-def _get_first_prompt(lines: Iterable[str]) -> str:
-    """Extract the first user prompt from the JSONL stream."""
-    for line in lines:
-        data = _parse_json_line(line)
-        if not data:
-            continue
-        msg_type = data.get("type")
-        payload = data.get("payload", {})
+    Returns:
+        Tuple (date_display, timestamp, prompt), with "" / None for anything not found.
+    """
+    date_display: Any = ""
+    timestamp: Optional[datetime] = None
+    prompt = ""
+    date_found = False
+
+    with open(input_path, 'rb') as f:
+        for line in f:
+            data = _parse_json_line(line)
+            if not data:
+                continue
 
-        if msg_type == "event_msg" and payload.get("type") == "user_message":
-            text = payload.get("message", "")
-            if text:
-                return _extract_user_request_from_context(text)
-    return ""
+            if timestamp is None:
+                raw_timestamp = _get_record_timestamp(data)
+                if raw_timestamp is not None:
+                    timestamp = _parse_iso_datetime(raw_timestamp)
+                    if not date_found:
+                        # Derive the display date from the same parse; format_timestamp only for unparseable values
+                        date_display = timestamp.strftime(DATE_FORMAT) if timestamp else format_timestamp(raw_timestamp)
+                        date_found = True
+
+            if not prompt and data.get("type") == "event_msg":
+                payload = data.get("payload", _EMPTY)
+                if isinstance(payload, dict) and payload.get("type") == "user_message":
+                    text = payload.get("message", "")
+                    if text:
+                        prompt = _extract_user_request_from_context(text)
+
+            if timestamp is not None and prompt:
+                break
+
+    return date_display, timestamp, prompt
 
 
 def _extract_user_request_from_context(text: str) -> str:
@@ -194,51 +297,154 @@ def _extract_user_request_from_context(text: str) -> str:
     return match.group(1).strip()
 
 def _collect_index_entries(input_folder: str, output_folder: str) -> List[Dict[str, Any]]:
-    """Collect index entries for converted sessions under the output folder."""
-    entries = []
-    for dirpath, _, filenames in os.walk(input_folder):
-        for filename in filenames:
-            if not filename.lower().endswith(".jsonl"):
-                continue
-            input_path = os.path.join(dirpath, filename)
-            rel_path = os.path.relpath(input_path, input_folder)
-            rel_base, _ = os.path.splitext(rel_path)
-            output_path = os.path.join(output_folder, "converted_sessions", rel_base + ".html")
-            if not os.path.exists(output_path):
-                continue
-            try:
-                with open(input_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-            except Exception:
+    """Collect index entries for converted sessions under the output folder.
+
+    Scanned metadata is cached in INDEX_CACHE_FILENAME next to the overview,
+    keyed by each log's relative path and validated by its (mtime_ns, size),
+    so only new or changed logs are read again.
+    """
+    cache_path = os.path.join(output_folder, INDEX_CACHE_FILENAME)
+    old_cache = _load_index_cache(cache_path)
+    new_cache: Dict[str, Tuple[Tuple[int, int], SessionHeader]] = {}
+
+    # 1. Walk the tree (cheap) and keep only logs that already have a transcript
+    sessions: List[Tuple[str, str]] = []
+    to_scan: List[Tuple[str, str, Tuple[int, int]]] = []
+    sessions_root = os.path.join(output_folder, "converted_sessions")
+    for input_path, rel_path in _iter_jsonl(input_folder):
+        output_path = os.path.join(sessions_root, rel_path.rsplit(".", 1)[0] + ".html")
+        try:
+            os.stat(output_path)
+            input_stat = os.stat(input_path)
+        except OSError:
+            continue    # Not converted (yet), or the log vanished
+        sessions.append((rel_path, output_path))
+
+        signature = (input_stat.st_mtime_ns, input_stat.st_size)
+        cached = old_cache.get(rel_path)
+        if cached is not None and cached[0] == signature:
+            new_cache[rel_path] = cached
+        else:
+            to_scan.append((input_path, rel_path, signature))
+
+    # 2. Read the new or changed logs concurrently - mostly waiting on disk, and the JSON decoding runs in C
+    if to_scan:
+        with ThreadPoolExecutor(max_workers=INDEX_SCAN_WORKERS) as executor:
+            headers = executor.map(_try_scan_session_header, [input_path for input_path, _, _ in to_scan])
+            for (_, rel_path, signature), header in zip(to_scan, headers):
+                if header is not None:
+                    new_cache[rel_path] = (signature, header)
+
+    if new_cache != old_cache:
+        _save_index_cache(cache_path, new_cache)
+
+    # 3. Build the entries
+    keyed_entries: List[Tuple[Tuple[float, str], Dict[str, Any]]] = []
+    for rel_path, output_path in sessions:
+        cached = new_cache.get(rel_path)
+        if cached is None:
+            continue    # Unreadable log
+        date_display, timestamp, prompt = cached[1]
+        href = _path_to_href(os.path.relpath(output_path, output_folder))
+        # Newest first, then by path; sessions without a timestamp (key 0.0) go last
+        sort_key = (-(timestamp - DT_MIN).total_seconds() if timestamp else 0.0, rel_path)
+        keyed_entries.append((sort_key, {
+            "date": date_display or "Unknown",
+            "prompt": prompt,
+            "href": href,
+            "timestamp": timestamp,
+            "file": rel_path,
+            "rel_path": rel_path,
+        }))
+
+    keyed_entries.sort(key=itemgetter(0))  # One sort on a precomputed key instead of two stable passes
+    return [entry for _, entry in keyed_entries]
+
+
+def _load_index_cache(cache_path: str) -> Dict[str, Tuple[Tuple[int, int], SessionHeader]]:
+    """Load the overview metadata cache; a missing or unreadable cache is treated as empty.
+
+    The cache is plain JSON, {rel_path: [[mtime_ns, size], [date, iso_timestamp, prompt]]},
+    because it sits in a user-chosen (often synced) folder: a tampered file can at
+    worst produce wrong overview entries. Malformed entries are dropped and rescanned.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            raw_cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw_cache, dict):
+        return {}
+
+    cache: Dict[str, Tuple[Tuple[int, int], SessionHeader]] = {}
+    for rel_path, item in raw_cache.items():
+        try:
+            (mtime_ns, size), (date_display, raw_timestamp, prompt) = item
+            if not (type(mtime_ns) is int and type(size) is int
+                    and isinstance(date_display, str) and isinstance(prompt, str)):
                 continue
+            timestamp = datetime.fromisoformat(raw_timestamp) if raw_timestamp is not None else None
+        except (TypeError, ValueError):
+            continue
+        cache[rel_path] = ((mtime_ns, size), (date_display, timestamp, prompt))
+    return cache
+
+
+def _save_index_cache(cache_path: str, cache: Dict[str, Tuple[Tuple[int, int], SessionHeader]]) -> None:
+    """Write the overview metadata cache; failing to write it only costs a rescan next time."""
+    raw_cache = {
+        rel_path: [list(signature), [date_display, timestamp.isoformat() if timestamp else None, prompt]]
+        for rel_path, (signature, (date_display, timestamp, prompt)) in cache.items()
+    }
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(raw_cache, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)    # Never leave a half-written cache behind
+    except OSError:
+        pass
 
-            date_display = get_session_date(lines)
-            timestamp = _get_session_timestamp(lines)
-            prompt = _get_first_prompt(lines)
-            href = _path_to_href(os.path.relpath(output_path, output_folder))
-            entries.append({
-                "date": date_display or "Unknown",
-                "prompt": prompt,
-                "href": href,
-                "timestamp": timestamp,
-                "file": rel_path,
-                "rel_path": rel_path,
-            })
-
-    entries.sort(key=lambda e: e["rel_path"])
-    entries.sort(key=lambda e: e["timestamp"] or datetime.min, reverse=True)
-    return entries
+
+def _iter_jsonl(root: str) -> Iterator[Tuple[str, str]]:
+    """Yield (path, path relative to root) for every .jsonl file under root.
+
+    A stack-based os.scandir walk: the DirEntry type info avoids a stat per
+    entry, and the relative path is built up as we descend instead of calling
+    os.path.relpath per file. Like os.walk, symlinked folders are not followed
+    and unreadable folders are skipped.
+    """
+    stack = [(root, "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, rel_dir + name + os.sep))
+                    elif (name.endswith((".jsonl", ".JSONL")) or name[-6:].lower() == ".jsonl") and entry.is_file():
+                        yield entry.path, rel_dir + name
+        except OSError:
+            continue
+
+
+def _try_scan_session_header(input_path: str) -> Optional[SessionHeader]:
+    """Scan a log for its overview entry; return None if it cannot be read."""
+    try:
+        return _scan_session_header(input_path)
+    except Exception:
+        return None
 
 def write_index_html_for_folder(input_folder: str, output_folder: str) -> str:
     """Write the overview HTML file for a folder and return its path."""
 
     os.makedirs(output_folder, exist_ok=True)
     entries = _collect_index_entries(input_folder, output_folder)
-    html_content = _build_index_html(entries)
+    html_parts = _build_index_html_parts(entries)
     output_path = os.path.join(output_folder, "codex_sessions_overview.html")
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.writelines(html_parts)
 
     return output_path
 
@@ -246,6 +452,8 @@ def convert_single_file(
     input_path: str,
     output_folder: Optional[str] = None,
     input_root: Optional[str] = None,
+    force: bool = False,
+    write_index: bool = True,
 ) -> Tuple[bool, str]:
     """Convert a single JSONL log file into an HTML transcript.
 
@@ -253,119 +461,169 @@ def convert_single_file(
         input_path: Path to the JSONL input file.
         output_folder: Destination folder for output files. Defaults to the input file's folder.
         input_root: Root folder used to mirror input structure. Defaults to the input file's folder.
+        force: Rebuild the transcript even if it is newer than the log.
+        write_index: Rewrite the overview page after a conversion. Batch drivers pass False
+            and call write_index_html_for_folder once at the end.
 
     Returns:
         Tuple (success, message). On success, the output HTML is written under the output folder in the converted_sessions subfolder.
+        The message is "Cached" when an up-to-date transcript was kept and "Empty" for a zero-byte log.
+    """
+    success, message = _convert_file(input_path, output_folder, input_root, force)
+    if write_index and success and message == "Done":
+        try:
+            write_index_html_for_folder(
+                input_root or os.path.dirname(input_path),
+                output_folder or os.path.dirname(input_path),
+            )
+        except Exception as e:
+            return False, str(e)
+    return success, message
+
+
+def convert_files(
+    input_paths: List[str],
+    output_folder: Optional[str] = None,
+    input_root: Optional[str] = None,
+    force: bool = False,
+) -> List[Tuple[bool, str]]:
+    """Convert several JSONL log files (typically from one folder) in a single call.
+
+    Unlike convert_single_file, the overview page is not rewritten after every
+    file; the caller writes it once for the whole batch. The GUI submits one
+    call per folder chunk to its worker processes.
+
+    Args:
+        input_paths: Paths to the JSONL input files.
+        output_folder: Destination folder for output files.
+        input_root: Root folder used to mirror input structure.
+        force: Rebuild transcripts even if they are newer than their logs.
+
+    Returns:
+        One (success, message) tuple per input path, in the same order.
     """
+    return [_convert_file(path, output_folder, input_root, force) for path in input_paths]
+
+
+def _convert_file(
+    input_path: str,
+    output_folder: Optional[str],
+    input_root: Optional[str],
+    force: bool,
+) -> Tuple[bool, str]:
+    """Render one JSONL log into its HTML transcript, without touching the overview page."""
     # 1. Path Setup
     output_folder = output_folder or os.path.dirname(input_path)
     input_root = input_root or os.path.dirname(input_path)
     
     rel_path = os.path.relpath(input_path, input_root)
-    rel_base, _ = os.path.splitext(rel_path)
+    rel_base = rel_path.rsplit(".", 1)[0]  # Inputs always carry the .jsonl suffix
     
     output_path = os.path.join(output_folder, "converted_sessions", rel_base + ".html")
     output_dir = os.path.dirname(output_path)
+    tmp_path = output_path + ".tmp"     # Written first and renamed into place, so a failed run never leaves a partial transcript
 
     try:
+        # 2. Fast Paths: a single stat() decides whether the log needs to be read at all
+        input_stat = os.stat(input_path)
+        if input_stat.st_size == 0:
+            return False, "Empty"
+        if not force:
+            try:
+                if os.stat(output_path).st_mtime >= input_stat.st_mtime:
+                    return True, "Cached"
+            except FileNotFoundError:
+                pass
+
         os.makedirs(output_dir, exist_ok=True)
         
-        # Performance Note: readlines() loads the whole file into memory, but the logs are not that large that it should cause problem
-        with open(input_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # Performance Note: the log is memory-mapped and parsed as bytes line by line, so it stays in the page cache instead of being copied into a list of str
+        with open(input_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # Non-empty, checked above
 
-        session_date = get_session_date(lines)
-        
         overview_rel_path = os.path.relpath(
             os.path.join(output_folder, "codex_sessions_overview.html"), 
             output_dir
         )
         index_href = _path_to_href(overview_rel_path)  # Create hypertext reference back to Overview file
 
-        # 3. Initialize State
-        html_parts = [get_html_header(session_date, index_href=index_href)]
-        
-        processed_user_messages: Set[int]      = set()  # hashes of user chat text messages
-        processed_user_events: Set[int]        = set()  # hashes of user chat events (contains additional context apart from the user's prompt)
-        processed_assistant_messages: Set[int] = set()  # hashes of all assistant text
-        processed_events_other: Set[int]       = set()  # hashes of Tool/Dev
-        processed_turn_contexts: Set[int]      = set()  # hashes of Turn Context Info, currently not used
+        # 3. Initialize State - one fresh hash set per dedup group (see PROCESSING_MAP_TEMPLATE)
+        hash_sets: Dict[str, Set[int]] = {group: set() for group in PROCESSING_HASH_GROUPS}
 
         # 4. Configuration Map
-        # Structure: Key -> (Display Name, CSS Class, Icon, Hash Set)
+        # Structure: Key -> (Display Name, CSS Class, Icon, Hash Set); names are capitalized here, not per message
         processing_map: Dict[str, Tuple[str, str, str, Set[int]]] = {
-            # --- Event Messages (Key = 'type') ---
-            "user_message":  ("User",      "role-user-chat",   ICON_USER,      processed_user_messages),
-            "agent_message": ("Assistant", "role-assistant",   ICON_ASSISTANT, processed_assistant_messages),
-
-            # --- Response Items (Key = 'role') ---
-            "user":          ("User",      "role-user-log",    ICON_USER,      processed_user_events),
-            "assistant":     ("Assistant", "role-assistant",   ICON_ASSISTANT, processed_assistant_messages),
-            
-            # --- Fallbacks ---
-            "developer":     ("Developer", "role-developer",   ICON_GEAR,      processed_events_other),
-            "default":       ("Developer", "role-developer",   ICON_GEAR,      processed_events_other),
-
-            # --- Turn Context ---
-            "turn_context":  ("Model Info", "role-model-info", ICON_GEAR,      processed_turn_contexts),
+            key: (name.capitalize(), css_class, icon, hash_sets[group])
+            for key, (name, css_class, icon, group) in PROCESSING_MAP_TEMPLATE.items()
         }
 
         rendered_message_count = 0
 
-        # 5. Main Loop
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        # 5. Main Loop - a single pass over the log; each block is streamed straight to the output file.
+        # The header needs the session date, so blocks are held back only until the first timestamped record.
+        with mapped, open(tmp_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as out:
+            write = out.write
+            deferred_blocks: List[str] = []
+            emit = deferred_blocks.append
+            header_written = False
 
-            try:
+            for line in _iter_mapped_lines(mapped):
+                # No strip(): the JSON parser ignores surrounding whitespace, and blank lines fail to parse
                 data = _parse_json_line(line)
                 if data is None:
                     continue
-                
-                msg_type = data.get("type")
-                payload = data.get("payload", {})
-                html_block = ""
-
-                # Dispatch logic
-                if msg_type == "event_msg":
-                    html_block = _build_event_message(payload, processing_map)
-                elif msg_type == "response_item":
-                    html_block = _build_response_item(payload, processing_map)
-                elif msg_type == "turn_context":
-                    html_block = _build_turn_context_message(payload, processing_map)
-
-                if html_block:
-                    html_parts.append(html_block)
-                    rendered_message_count += 1
-
-            except Exception as e:
-                # 6. Error Handling: Log to console AND inject into HTML
-                print(f"Error on line: {line[:100]}...")
-                traceback.print_exc()
-                
-                error_html = (
-                    f'<div style="border: 2px solid #ef4444; background: #fef2f2; color: #b91c1c; '
-                    f'padding: 12px; margin: 16px 0; border-radius: 8px; font-family: monospace;">'
-                    f'<strong>Conversion Error:</strong> {html.escape(str(e))}'
-                    f'</div>'
-                )
-                html_parts.append(error_html)
-                continue
 
-        # 7. Finalization
-        html_parts.append(get_html_footer())
+                try:
+                    if not header_written:
+                        raw_timestamp = _get_record_timestamp(data)
+                        if raw_timestamp is not None:
+                            write(get_html_header(format_timestamp(raw_timestamp), index_href=index_href))
+                            write("".join(deferred_blocks))
+                            emit = write
+                            header_written = True
+
+                    msg_type = data.get("type")
+                    payload = data.get("payload", _EMPTY)
+                    html_block = ""
+
+                    # Dispatch logic
+                    if msg_type == "event_msg":
+                        html_block = _build_event_message(payload, processing_map)
+                    elif msg_type == "response_item":
+                        html_block = _build_response_item(payload, processing_map)
+                    elif msg_type == "turn_context":
+                        html_block = _build_turn_context_message(payload, processing_map)
+
+                    if html_block:
+                        emit(html_block)
+                        rendered_message_count += 1
+
+                except Exception as e:  # Parsing is guarded above; this keeps one malformed record from failing the file
+                    # 6. Error Handling: Log to console AND inject into HTML
+                    print(f"Error on line: {line[:100].rstrip().decode('utf-8', 'replace')}...")
+                    traceback.print_exc()
+                    
+                    emit(ERROR_HTML_TEMPLATE.format(html.escape(str(e))))
+                    continue
+
+            # 7. Finalization
+            if not header_written:  # No record carried a timestamp
+                write(get_html_header("", index_href=index_href))
+                write("".join(deferred_blocks))
+            write(HTML_FOOTER)
 
         if rendered_message_count == 0:
+            os.remove(tmp_path)
             return False, "Empty/Invalid Log"
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("".join(html_parts))
-
-        write_index_html_for_folder(input_root, output_folder)
+        os.replace(tmp_path, output_path)   # Atomic on POSIX and Windows
         return True, "Done"
 
     except Exception as e:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False, str(e)
 
 
@@ -384,7 +642,12 @@ def create_gui() -> None:
     """Launch the Tkinter GUI application."""
     root = tk.Tk()
     _set_window_icon(root)
-    app = BatchConverterGUI(convert_single_file, root)
+    app = BatchConverterGUI(
+        convert_single_file,
+        root,
+        index_callback=write_index_html_for_folder,
+        batch_callback=convert_files,
+    )
     root.mainloop()
 
 
@@ -3,8 +3,14 @@ HTML rendering helpers for Codex JSONL conversion.
 
 Most AI generated part, regexes untouched, html/css/JS only lightly modified.
 
+Performance note: the hot path is pure string work (regex, json, html escaping).
+Numba was considered and rejected, it only falls back to object mode on strings.
+Instead, every formatting pass is gated on a cheap substring check, so plain
+messages never reach the regex engine.
+
 """
 
+import functools
 import html
 import json
 import re
@@ -13,12 +19,10 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 TOOL_OUTPUT_TRUNCATE_LIMIT = 4000   # Tool Output can be large, 4000 chosen as a reasonable middle-ground
 PROMPT_TRUNCATE_LIMIT = 300         # Limit used in the Overview table
+FORMAT_CACHE_SIZE = 256             # Recently rendered message texts kept by format_content
 
 TEXT_BLOCK_TYPES = {"input_text", "output_text", "summary_text", "text"}
 
-CONTEXT_PLACEHOLDER = "__CONTEXT_PROTECTED__"
-CODE_BLOCK_PLACEHOLDER_PREFIX = "__CODE_BLOCK_"
-
 ICON_USER           = "\N{BUST IN SILHOUETTE}"
 ICON_QUESTION       = "\N{BLACK QUESTION MARK ORNAMENT}"
 ICON_USER_REQUEST   = f"{ICON_QUESTION}"
@@ -28,26 +32,40 @@ ICON_TOOL           = "\N{HAMMER AND WRENCH}"
 ICON_GEAR           = "\N{GEAR}"
 ICON_FILTERS        = "\N{LEFT-POINTING MAGNIFYING GLASS}"
 
+CONTEXT_PLACEHOLDER = "__CONTEXT_PROTECTED__"
+CODE_BLOCK_PLACEHOLDER_PREFIX = "__CODE_BLOCK_"
+CONTEXT_SECTION_MARKER = "Context from my IDE setup:"
+
 CONTEXT_SECTION_PATTERN = re.compile(
     r"(?ms)(^#+\s*Context from my IDE setup:)"
     r"(.*?)(?=^#+\s*My request for Codex:|\Z)"
 )
-CODE_BLOCK_PATTERN = re.compile(r"```(\w+)?\n?(.*?)```", re.DOTALL)
+CODE_FENCE = "```"
+CODE_LANG_PATTERN = re.compile(r"\w*")  # Language tag right after an opening fence; anchored, so it never backtracks
+CODE_BLOCK_PLACEHOLDER_PATTERN = re.compile(re.escape(CODE_BLOCK_PLACEHOLDER_PREFIX) + r"(0|[1-9][0-9]*)__")
 NEWLINES_BEFORE_HEADER_PATTERN = re.compile(r"\n{2,}(?=#)")
 NEWLINES_PATTERN = re.compile(r"\n{3,}")
 MY_REQUEST_HEADER_PATTERN = re.compile(r"(?m)^#+\s+My request for Codex:?")
-HEADER_PATTERNS = [
-    (re.compile(r"(?m)^# (.*?)$"), r"<h1>\1</h2>"),
-    (re.compile(r"(?m)^## (.*?)$"), r"<h2>\1</h3>"),
-    (re.compile(r"(?m)^### (.*?)$"), r"<h3>\1</h4>"),
-    (re.compile(r"(?m)^#### (.*?)$"), r"<h4>\1</h4>"),
-]
+# One pass for all four header levels; a rewritten line no longer starts with '#'
+HEADER_PATTERN = re.compile(r"(?m)^(#{1,4}) (.*?)$")
+HEADER_TAGS = {level: (f"<h{level}>", f"</h{level}>") for level in range(1, 5)}
 STRONG_PATTERN = re.compile(r"\*\*(.*?)\*\*")
 INLINE_CODE_PATTERN = re.compile(r"`([^`]+)`")
 REL_PATH_SPLIT_PATTERN = re.compile(r"[\\\\/]+")
+HTML_UNSAFE_PATTERN = re.compile(r"[&<>\"']")
+
+# Shared JSON codec for tool-call arguments instead of building one per call
+TOOL_ARGS_DECODER = json.JSONDecoder()
+TOOL_ARGS_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+TOOL_ARGS_INLINE_LIMIT = 160   # Short single-line argument strings are shown as-is, without a JSON round-trip
 
 MY_REQUEST_HEADER_REPLACEMENT = f"<h2>{ICON_USER_REQUEST} My request for Codex:</h2>"
 
+# Fixed block openings, formatted once instead of on every rendered block
+REASONING_BLOCK_OPEN = f'<div class="message type-reasoning"><span class="reasoning-title">{ICON_REASONING} Reasoning</span>'
+TOOL_CALL_BLOCK_OPEN = f'<div class="message type-tool-call"><div class="tool-header">{ICON_TOOL} Tool Call: '
+TOOL_OUTPUT_BLOCK_OPEN = f'<div class="message type-tool-output"><div class="tool-header">{ICON_TOOL} Tool Call Output</div>'
+
 
 def extract_text_content(content_data: Any) -> str:
     """Extract textual content from nested message structures.
@@ -70,8 +88,20 @@ def extract_text_content(content_data: Any) -> str:
     return "".join(text_parts)
 
 
+def _fast_escape(text: str, _escape=html.escape, _needs_escape=HTML_UNSAFE_PATTERN.search) -> str:
+    """HTML-escape text, returning it untouched when it has no unsafe characters."""
+    return _escape(text) if _needs_escape(text) else text
+
+
+def _has_markup(text: str) -> bool:
+    """Cheap substring pre-check: can any formatting pass in format_content change the text?"""
+    return "`" in text or "#" in text or "**" in text or "\n\n" in text
+
+
 def _extract_context_block(text: str) -> Tuple[str, Optional[str]]:
     """Extract and replace the IDE context section with a placeholder."""
+    if CONTEXT_SECTION_MARKER not in text:   # Skips the multi-line regex for most messages
+        return text, None
     match = CONTEXT_SECTION_PATTERN.search(text)
     if not match:
         return text, None
@@ -80,29 +110,73 @@ def _extract_context_block(text: str) -> Tuple[str, Optional[str]]:
     return replaced_text, context_content
 
 
-def _extract_code_blocks(text: str) -> Tuple[str, Dict[str, str]]:
-    """Replace fenced code blocks with placeholders and collect their HTML."""
-    code_blocks = {}
+def _extract_code_blocks(text: str) -> Tuple[str, List[str]]:
+    """Replace fenced code blocks with numbered placeholders and collect their HTML in order."""
+    code_blocks: List[str] = []
+    if CODE_FENCE not in text:
+        return text, code_blocks
+
+    # Fences are paired with str.find, the same pairing as a lazy ```(\w+)?\n?(.*?)``` match.
+    # Literal spans and placeholders are collected and joined once.
+    pieces = []
+    pos = 0
+    while True:
+        start = text.find(CODE_FENCE, pos)
+        if start == -1:
+            break
+        lang_end = CODE_LANG_PATTERN.match(text, start + 3).end()
+        content_start = lang_end + 1 if text.startswith("\n", lang_end) else lang_end
+        end = text.find(CODE_FENCE, content_start)
+        if end == -1:
+            break   # Without a closing fence here, no later opening fence has one either
+        lang = text[start + 3:lang_end] or "text"
+        pieces.append(text[pos:start])
+        pieces.append(f"{CODE_BLOCK_PLACEHOLDER_PREFIX}{len(code_blocks)}__")
+        code_blocks.append(f'<pre><code class="language-{lang}">{text[content_start:end]}</code></pre>')
+        pos = end + 3
+    if not code_blocks:
+        return text, code_blocks
+    pieces.append(text[pos:])
+    return "".join(pieces), code_blocks
+
+
+def _restore_code_blocks(text: str, code_blocks: List[str]) -> str:
+    """Put the code block HTML back in place of its placeholders in a single pass.
+
+    The text is split at the placeholders, whose indices land at the odd
+    positions, and spliced back together with one join. A placeholder-like
+    string that the text already contained is left as is, unless it names
+    an extracted block.
+    """
+    parts = CODE_BLOCK_PLACEHOLDER_PATTERN.split(text)
+    block_count = len(code_blocks)
+    for i in range(1, len(parts), 2):
+        index = int(parts[i])
+        parts[i] = code_blocks[index] if index < block_count else f"{CODE_BLOCK_PLACEHOLDER_PREFIX}{parts[i]}__"
+    return "".join(parts)
 
-    def store_code_block(match):
-        key = f"{CODE_BLOCK_PLACEHOLDER_PREFIX}{len(code_blocks)}__"
-        lang = match.group(1) or "text"
-        content = match.group(2)
-        code_blocks[key] = f'<pre><code class="language-{lang}">{content}</code></pre>'
-        return key
 
-    return CODE_BLOCK_PATTERN.sub(store_code_block, text), code_blocks
+def _replace_header(match: re.Match) -> str:
+    """Wrap a markdown header line in the tag for its level."""
+    open_tag, close_tag = HEADER_TAGS[len(match.group(1))]
+    return f"{open_tag}{match.group(2)}{close_tag}"
 
 
 def _apply_markdown_formatting(text: str) -> str:
-    """Convert a subset of markdown-style formatting into HTML tags."""
-    text = NEWLINES_BEFORE_HEADER_PATTERN.sub("\n", text)
-    text = NEWLINES_PATTERN.sub("\n\n", text)
-    text = MY_REQUEST_HEADER_PATTERN.sub(MY_REQUEST_HEADER_REPLACEMENT, text)
-    for pattern, replacement in HEADER_PATTERNS:
-        text = pattern.sub(replacement, text)
-    text = STRONG_PATTERN.sub(r"<strong>\1</strong>", text)
-    text = INLINE_CODE_PATTERN.sub(r'<code class="inline-code">\1</code>', text)
+    """Convert a subset of markdown-style formatting into HTML tags.
+
+    Each pass is skipped when the characters it needs are absent.
+    """
+    if "\n\n" in text:
+        text = NEWLINES_BEFORE_HEADER_PATTERN.sub("\n", text)
+        text = NEWLINES_PATTERN.sub("\n\n", text)
+    if "#" in text:
+        text = MY_REQUEST_HEADER_PATTERN.sub(MY_REQUEST_HEADER_REPLACEMENT, text)
+        text = HEADER_PATTERN.sub(_replace_header, text)
+    if "**" in text:
+        text = STRONG_PATTERN.sub(r"<strong>\1</strong>", text)
+    if "`" in text:
+        text = INLINE_CODE_PATTERN.sub(r'<code class="inline-code">\1</code>', text)
     return text
 
 
@@ -115,6 +189,7 @@ def _wrap_context_block(context_content: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_content(text: str) -> str:
     """Render message content as safe, styled HTML.
 
@@ -122,6 +197,10 @@ def format_content(text: str) -> str:
     Markdown-like headers and code blocks to HTML, and restores the protected
     content at the end.
 
+    The result depends only on the text, so recent results are cached: the
+    same prompt shows up both as a chat event and as a logged user message,
+    and the model-info block repeats on every turn.
+
     Args:
         text: Raw message content.
 
@@ -131,13 +210,16 @@ def format_content(text: str) -> str:
     if not text:
         return ""
 
-    escaped_text = html.escape(text)
+    escaped_text = _fast_escape(text)
+    if not _has_markup(escaped_text):
+        return escaped_text
+
     escaped_text, context_content = _extract_context_block(escaped_text)
     escaped_text, code_blocks = _extract_code_blocks(escaped_text)
     escaped_text = _apply_markdown_formatting(escaped_text)
 
-    for key, code_html in code_blocks.items():
-        escaped_text = escaped_text.replace(key, code_html)
+    if code_blocks:
+        escaped_text = _restore_code_blocks(escaped_text, code_blocks)
 
     if context_content is not None:
         escaped_text = escaped_text.replace(
@@ -148,22 +230,34 @@ def format_content(text: str) -> str:
     return escaped_text
 
 
-def get_html_header(date_str: str = "", index_href: str = "codex_sessions_overview.html") -> str:
-    """Build the HTML document header and top-of-page layout.
+CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+CSS_SPACE_AROUND_PATTERN = re.compile(r"\s*([{};])\s*")
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
 
-    Args:
-        date_str: Optional session date string shown under the title.
-        index_href: Relative link to the overview index.
 
-    Returns:
-        The HTML header portion including CSS and the filter sidebar.
-    """
-    date_html = ""
-    if date_str:
-        # Reduced bottom margin here because the separator adds its own spacing
-        date_html = f'<div style="text-align: center; color: #888; margin-bottom: 10px; font-size: 0.9em; font-weight: 500;">{date_str}</div>'
+def _minify_css(css: str) -> str:
+    """Drop comments and layout whitespace from a stylesheet."""
+    css = CSS_COMMENT_PATTERN.sub("", css)
+    css = WHITESPACE_RUN_PATTERN.sub(" ", css)
+    return CSS_SPACE_AROUND_PATTERN.sub(r"\1", css).strip()
+
+
+def _minify_js(js: str) -> str:
+    """Drop indentation and blank lines; line breaks stay for automatic semicolon insertion."""
+    return "\n".join(line.strip() for line in js.splitlines() if line.strip())
+
 
-    return f"""<!DOCTYPE html>
+def _minify_embedded(page: str, open_tag: str, close_tag: str, minify) -> str:
+    """Minify the first inline block between open_tag and close_tag in a page template."""
+    start = page.index(open_tag) + len(open_tag)
+    end = page.index(close_tag, start)
+    return f"{page[:start]}{minify(page[start:end])}{page[end:]}"
+
+
+# The transcript header is formatted once at import; only the overview link and
+# the date line differ between files, so the template is split at those two slots.
+HEADER_SLOT_MARKER = "\0slot\0"
+HTML_HEADER_TEMPLATE = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -354,21 +448,41 @@ def get_html_header(date_str: str = "", index_href: str = "codex_sessions_overvi
         <div class="filter-group"><input type="checkbox" id="check-tool-output"><label for="check-tool-output">Tool Outputs</label></div>
         <div class="filter-group"><input type="checkbox" id="check-used-model"><label for="check-used-model">Model Info</label></div>
         <hr style="border: 0; border-top: 1px solid #eee;">
-        <div class="filter-group"><a class="index-link" href="{index_href}">&#127968; Overview</a></div>
+        <div class="filter-group"><a class="index-link" href="{HEADER_SLOT_MARKER}">&#127968; Overview</a></div>
     </div>
 </div>
 
 <div class="wrapper">
 <div class="container">
     <h1 style="text-align: center; color: #333; margin-bottom: 10px;">Codex Session Transcript</h1>
-    {date_html}
+    {HEADER_SLOT_MARKER}
     <div class="header-separator"></div>
 """
+# The stylesheet and script are written into every transcript, so they are minified once here
+HTML_HEADER_TEMPLATE = _minify_embedded(HTML_HEADER_TEMPLATE, "<style>", "</style>", _minify_css)
+HTML_HEADER_PREFIX, HTML_HEADER_MIDDLE, HTML_HEADER_SUFFIX = HTML_HEADER_TEMPLATE.split(HEADER_SLOT_MARKER)
 
 
-def get_html_footer() -> str:
-    """Return the HTML footer and JavaScript for UI interactivity."""
-    return """
+def get_html_header(date_str: str = "", index_href: str = "codex_sessions_overview.html") -> str:
+    """Build the HTML document header and top-of-page layout.
+
+    Args:
+        date_str: Optional session date string shown under the title.
+        index_href: Relative link to the overview index.
+
+    Returns:
+        The HTML header portion including CSS and the filter sidebar.
+    """
+    date_html = ""
+    if date_str:
+        # Reduced bottom margin here because the separator adds its own spacing
+        date_html = f'<div style="text-align: center; color: #888; margin-bottom: 10px; font-size: 0.9em; font-weight: 500;">{date_str}</div>'
+
+    return "".join((HTML_HEADER_PREFIX, index_href, HTML_HEADER_MIDDLE, date_html, HTML_HEADER_SUFFIX))
+
+
+# HTML footer and JavaScript for UI interactivity, identical for every transcript
+HTML_FOOTER = """
 </div>
 </div>
 <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/prism.min.js"></script>
@@ -406,13 +520,15 @@ def get_html_footer() -> str:
 </body>
 </html>
 """
+HTML_FOOTER = _minify_embedded(HTML_FOOTER, "<script>\n", "</script>", _minify_js)
 
 
 def _should_emit_text(text: str, seen_set: Set[int]) -> bool:
     """Determine if text is unique and should be included in the html output.
 
     This function filters out empty strings and exact duplicates. It uses
-    hashing to track seen content.
+    hashing to track seen content; the text is hashed once and the set is
+    probed once, the size change telling whether the hash was new.
 
     Args:
         text (str): The string content to check.
@@ -424,18 +540,16 @@ def _should_emit_text(text: str, seen_set: Set[int]) -> bool:
     """
     if not text:
         return False
-    text_hash = hash(text)
-    if text_hash in seen_set:
-        return False
-    seen_set.add(text_hash)
-    return True
+    seen_count = len(seen_set)
+    seen_set.add(hash(text))
+    return len(seen_set) != seen_count
 
 
-def _build_message_html(role: str, css_class: str, icon: str, text: str) -> str:
-    """Render a chat bubble for a single message."""
+def _build_message_html(display_name: str, css_class: str, icon: str, text: str) -> str:
+    """Render a chat bubble for a single message; display_name is shown as given."""
     return (
         f'<div class="message {css_class}">'
-        f'<div class="role">{icon} {role.capitalize()}</div>'
+        f'<div class="role">{icon} {display_name}</div>'
         f'<div class="content">{format_content(text)}</div>'
         f'</div>'
     )
@@ -444,29 +558,34 @@ def _build_message_html(role: str, css_class: str, icon: str, text: str) -> str:
 def _build_reasoning_html(text: str) -> str:
     """Render a styled reasoning block."""
     return (
-        '<div class="message type-reasoning">'
-        f'<span class="reasoning-title">{ICON_REASONING} Reasoning</span>'
+        f'{REASONING_BLOCK_OPEN}'
         f'<div class="reasoning-content">{format_content(text)}</div>'
         '</div>'
     )
 
 
 def _format_tool_args(args: Any) -> str:
-    """Pretty-print tool arguments as JSON when possible."""
-    try:
-        parsed = json.loads(args) if isinstance(args, str) else args
-        return json.dumps(parsed, indent=2)
-    except Exception:
-        return str(args)
+    """Pretty-print tool arguments as JSON when possible.
+
+    Strings that already span several lines are laid out by the caller and are
+    returned as-is; only compact strings are decoded and re-indented.
+    """
+    if isinstance(args, str):
+        if "\n" in args or len(args) <= TOOL_ARGS_INLINE_LIMIT:
+            return args
+        try:
+            args = TOOL_ARGS_DECODER.decode(args)
+        except ValueError:
+            return args
+    return TOOL_ARGS_ENCODER.encode(args)
 
 
 def _build_tool_call_html(tool: str, args: Any, lang: str = "json") -> str:
     """Render a tool call message with formatted arguments."""
     pretty = _format_tool_args(args)
     return (
-        '<div class="message type-tool-call">'
-        f'<div class="tool-header">{ICON_TOOL} Tool Call: {html.escape(tool)}</div>'
-        f'<pre><code class="language-{lang}">{html.escape(pretty)}</code></pre>'
+        f'{TOOL_CALL_BLOCK_OPEN}{_fast_escape(tool)}</div>'
+        f'<pre><code class="language-{lang}">{_fast_escape(pretty)}</code></pre>'
         '</div>'
     )
 
@@ -474,9 +593,8 @@ def _build_tool_call_html(tool: str, args: Any, lang: str = "json") -> str:
 def _build_custom_tool_call_html(tool: str, inp: str) -> str:
     """Render a custom tool call message."""
     return (
-        '<div class="message type-tool-call">'
-        f'<div class="tool-header">{ICON_TOOL} Tool Call: {html.escape(tool)}</div>'
-        f'<pre><code class="language-diff">{html.escape(inp)}</code></pre>'
+        f'{TOOL_CALL_BLOCK_OPEN}{_fast_escape(tool)}</div>'
+        f'<pre><code class="language-diff">{_fast_escape(inp)}</code></pre>'
         '</div>'
     )
 
@@ -488,9 +606,8 @@ def _build_tool_output_html(output: str) -> str:
         output = output[:TOOL_OUTPUT_TRUNCATE_LIMIT]
         truncated_note = '<div class="truncated">... (truncated)</div>'
     return (
-        '<div class="message type-tool-output">'
-        f'<div class="tool-header">{ICON_TOOL} Tool Call Output</div>'
-        f'<pre><code class="language-text">{html.escape(output)}</code></pre>'
+        f'{TOOL_OUTPUT_BLOCK_OPEN}'
+        f'<pre><code class="language-text">{_fast_escape(output)}</code></pre>'
         f'{truncated_note}'
         '</div>'
     )
@@ -521,7 +638,8 @@ def _build_response_message(payload: Dict[str, Any], processing_map: Dict[str, t
     role = payload.get("role", "unknown")
     text = extract_text_content(payload.get("content"))
 
-    config = processing_map.get(role.lower(), processing_map.get("default"))
+    # Config tuples are never empty, so lower() and the "default" fallback run only on a miss
+    config = processing_map.get(role) or processing_map.get(role.lower()) or processing_map.get("default")
 
     if not config or not text:
         return ""
@@ -614,19 +732,23 @@ def _sort_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     )
 
 
-def _render_entries_table(entries: List[Dict[str, Any]]) -> str:
-    """Render a table of session entries for a single folder."""
+def _render_entries_table(entries: List[Dict[str, Any]], out: List[str]) -> None:
+    """Append the table of session entries for a single folder to out (nothing for no entries)."""
     if not entries:
-        return ""
-    rows = []
+        return
+    out.append(
+        "<table class=\"entries\">"
+        "<thead><tr><th>Date</th><th>Initial prompt</th></tr></thead>"
+        "<tbody>"
+    )
     for entry in _sort_entries(entries):
-        date_text = html.escape(entry["date"])
+        date_text = _fast_escape(entry["date"])
         full_prompt = entry["prompt"] or ""
         prompt_preview = _truncate_prompt(full_prompt)
-        prompt_preview_text = html.escape(prompt_preview)
-        prompt_full_text = html.escape(full_prompt)
-        href = html.escape(entry["href"])
-        prompt_data = html.escape(full_prompt, quote=True)
+        prompt_preview_text = _fast_escape(prompt_preview)
+        prompt_full_text = _fast_escape(full_prompt)   # Quotes are escaped too, so it also serves as the attribute value
+        href = _fast_escape(entry["href"])
+        prompt_data = prompt_full_text
         if full_prompt and prompt_preview != full_prompt:
             prompt_html = (
                 '<details class="prompt-details">'
@@ -638,45 +760,32 @@ def _render_entries_table(entries: List[Dict[str, Any]]) -> str:
             )
         else:
             prompt_html = prompt_preview_text
-        rows.append(
+        out.append(
             f"<tr class=\"entry-row\" data-prompt=\"{prompt_data}\"><td><a href=\"{href}\">{date_text}</a></td><td class=\"prompt\">{prompt_html}</td></tr>"
         )
-    return (
-        "<table class=\"entries\">"
-        "<thead><tr><th>Date</th><th>Initial prompt</th></tr></thead>"
-        "<tbody>"
-        + "".join(rows)
-        + "</tbody></table>"
-    )
+    out.append("</tbody></table>")
+
 
+def _render_folder_sections(node: Dict[str, Any], out: List[str], level: int = 0) -> None:
+    """Append nested <details> sections for folder trees to out.
 
-def _render_folder_sections(node: Dict[str, Any], level: int = 0) -> str:
-    """Render nested <details> sections for folder trees."""
-    sections = []
+    Every fragment goes into the one shared list, so nothing is concatenated
+    per nesting level; a folder without any entries below it is dropped again.
+    """
     for name in sorted(node["children"]):
         child = node["children"][name]
-        child_html = _render_folder_sections(child, level + 1)
-        table_html = _render_entries_table(child["items"])
-        content = table_html + child_html
-        if not content:
-            continue
-        summary = html.escape(name)
-        sections.append(
-            f'<details class="folder level-{level + 1}"><summary>{summary}</summary>{content}</details>'
-        )
-    return "".join(sections)
-
+        start = len(out)
+        out.append(f'<details class="folder level-{level + 1}"><summary>{_fast_escape(name)}</summary>')
+        _render_entries_table(child["items"], out)
+        _render_folder_sections(child, out, level + 1)
+        if len(out) == start + 1:
+            del out[start:]
+        else:
+            out.append("</details>")
 
-def _build_index_html(entries: List[Dict[str, Any]]) -> str:
-    """Generate the HTML overview page for all sessions."""
-    if not entries:
-        body = "<p>No converted sessions found.</p>"
-    else:
-        tree = _build_index_tree(entries)
-        root_table = _render_entries_table(tree["items"])
-        body = root_table + _render_folder_sections(tree)
 
-    return f"""<!DOCTYPE html>
+# The overview page is formatted once at import as well; the folder tables go into its single slot.
+OVERVIEW_HTML_TEMPLATE = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -721,7 +830,7 @@ def _build_index_html(entries: List[Dict[str, Any]]) -> str:
             font-size: 0.98em;
         }}
         .search-bar input:focus {{ outline: 2px solid rgba(31, 157, 142, 0.25); border-color: rgba(31, 157, 142, 0.6); }}
-        .hidden {{ display: none !important; }}
+        tr.entry-row[data-hit="0"], details.folder[data-hit="0"] {{ display: none !important; }}
         .no-results {{
             text-align: center;
             color: var(--muted);
@@ -830,132 +939,216 @@ def _build_index_html(entries: List[Dict[str, Any]]) -> str:
                 </div>
             </div>
             <div id="no-results" class="no-results">No sessions match your search.</div>
-            {body}
+            {HEADER_SLOT_MARKER}
         </div>
     </div>
     <script>
         const searchBox = document.getElementById('search-box');
-        const rows = Array.from(document.querySelectorAll('tr.entry-row'));
-        const folders = Array.from(document.querySelectorAll('details.folder'));
+        // Only overview rows and folder sections carry these classes, so no selector matching is needed
+        const rows = Array.from(document.getElementsByClassName('entry-row'));
+        // Searchable text per row, lowercased once; highlighting does not change it
+        const haystacks = rows.map(row => (row.textContent + " " + (row.dataset.prompt || "")).toLowerCase());
+        // Marks currently inserted in each row, null for rows without highlights
+        const rowMarks = rows.map(() => null);
+        // Highlighting waits until a row scrolls into view: query still to highlight per row, and on-screen state
+        const rowPendingQuery = rows.map(() => null);
+        const rowOnScreen = rows.map(() => !('IntersectionObserver' in window));
+        if ('IntersectionObserver' in window) {{
+            const rowIndex = new Map(rows.map((row, i) => [row, i]));
+            const observer = new IntersectionObserver(entries => {{
+                for (const entry of entries) {{
+                    const i = rowIndex.get(entry.target);
+                    rowOnScreen[i] = entry.isIntersecting;
+                    if (entry.isIntersecting && rowPendingQuery[i]) {{
+                        rowMarks[i] = highlightText(rows[i], rowPendingQuery[i]);
+                        rowPendingQuery[i] = null;
+                    }}
+                }}
+            }});
+            for (const row of rows) observer.observe(row);
+        }}
+        // Indices of all rows, and of the rows matching the last query
+        const allRowIndices = rows.map((_, i) => i);
+        let matchedRowIndices = allRowIndices;
+        let lastQuery = '';
+        const folders = Array.from(document.getElementsByClassName('folder'));
+        // Last visibility written to each row and folder; data-hit is only touched when it changes
+        const rowHit = rows.map(() => true);
+        const folderHit = folders.map(() => true);
+        // Indices of each row's enclosing folders, innermost first
+        const folderIndex = new Map(folders.map((folder, i) => [folder, i]));
+        const rowFolders = rows.map(row => {{
+            const chain = [];
+            for (let el = row.parentElement; el; el = el.parentElement) {{
+                const f = folderIndex.get(el);
+                if (f !== undefined) chain.push(f);
+            }}
+            return chain;
+        }});
+
+        function setHit(el, states, i, hit) {{
+            if (states[i] !== hit) {{
+                states[i] = hit;
+                el.dataset.hit = hit ? '1' : '0';
+            }}
+        }}
         const noResults = document.getElementById('no-results');
 
         // --- NEW: Helper to remove existing highlights ---
-        function clearHighlights(root) {{
-            // Find all marks and replace them with their text content
-            const marks = root.querySelectorAll('mark.highlight');
+        function clearHighlights(marks) {{
+            // Replace the marks recorded by highlightText with their text content
+            const parents = new Set();
             for (const mark of marks) {{
                 const parent = mark.parentNode;
                 parent.replaceChild(document.createTextNode(mark.textContent), mark);
-                parent.normalize(); // Merge adjacent text nodes
+                parents.add(parent);
+            }}
+            // Merge adjacent text nodes once per parent, not once per mark
+            for (const parent of parents) {{
+                parent.normalize();
             }}
         }}
 
         // --- NEW: Helper to add highlights safely ---
+        // Returns the inserted marks, or null when nothing was highlighted
         function highlightText(root, query) {{
-            if (!query) return;
-            
-            // Escape special regex characters in the query
-            const escapedQuery = query.replace(/[.*+?^${{}}()|[\\]\\\\]/g, '\\\\$&');
-            const regex = new RegExp('(' + escapedQuery + ')', 'gi');
-
-            // TreeWalker traverses only Text Nodes, avoiding HTML tags
-            const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, null, false);
+            if (!query) return null;
+
+            // TreeWalker visits only Text Nodes; the filter accepts just the ones containing the query
+            const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {{
+                acceptNode(node) {{
+                    const tag = node.parentNode && node.parentNode.tagName;
+                    if (!tag || tag === 'SCRIPT' || tag === 'STYLE' || tag === 'MARK') return NodeFilter.FILTER_REJECT;
+                    return node.nodeValue.toLowerCase().includes(query) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_REJECT;
+                }}
+            }});
             const nodesToProcess = [];
-
             while (walker.nextNode()) {{
-                const node = walker.currentNode;
-                // Skip if parent is script/style
-                if (node.parentNode.tagName === 'SCRIPT' || node.parentNode.tagName === 'STYLE') continue;
-                
-                if (node.nodeValue.toLowerCase().includes(query)) {{
-                    nodesToProcess.push(node);
-                }}
+                nodesToProcess.push(walker.currentNode);
             }}
 
             // Replace matched text nodes with fragments containing <mark>
+            const marks = [];
             for (const node of nodesToProcess) {{
                 const val = node.nodeValue;
-                const parent = node.parentNode;
-                
-                // Double check match still exists (in case of overlaps)
-                if (regex.test(val)) {{
-                    const fragment = document.createDocumentFragment();
-                    let lastIdx = 0;
-                    
-                    val.replace(regex, (match, p1, offset) => {{
-                        // Append text before match
-                        if (offset > lastIdx) {{
-                            fragment.appendChild(document.createTextNode(val.substring(lastIdx, offset)));
-                        }}
-                        // Append highlighted match
-                        const mark = document.createElement('mark');
-                        mark.className = 'highlight';
-                        mark.textContent = match;
-                        fragment.appendChild(mark);
-                        
-                        lastIdx = offset + match.length;
-                        return match; // Return value not strictly needed for replace loop
-                    }});
-                    
-                    // Append text after last match
-                    if (lastIdx < val.length) {{
-                        fragment.appendChild(document.createTextNode(val.substring(lastIdx)));
+                const lower = val.toLowerCase();
+                // Offsets in the lowercased text only line up when lowercasing kept the length
+                if (lower.length !== val.length) continue;
+
+                const fragment = document.createDocumentFragment();
+                let lastIdx = 0;
+                let idx;
+                while ((idx = lower.indexOf(query, lastIdx)) !== -1) {{
+                    // Append text before match
+                    if (idx > lastIdx) {{
+                        fragment.appendChild(document.createTextNode(val.substring(lastIdx, idx)));
                     }}
-                    
-                    parent.replaceChild(fragment, node);
+                    // Append highlighted match
+                    const mark = document.createElement('mark');
+                    mark.className = 'highlight';
+                    mark.textContent = val.substring(idx, idx + query.length);
+                    fragment.appendChild(mark);
+                    marks.push(mark);
+                    lastIdx = idx + query.length;
                 }}
+
+                // Append text after last match
+                if (lastIdx < val.length) {{
+                    fragment.appendChild(document.createTextNode(val.substring(lastIdx)));
+                }}
+
+                node.parentNode.replaceChild(fragment, node);
             }}
+            return marks.length ? marks : null;
         }}
 
-        function updateFolderVisibility(query) {{
-            for (const folder of folders) {{
-                folder.classList.add('hidden');
+        function updateFolderVisibility(query, visibleRows) {{
+            // A folder is shown when any row below it is, including rows in nested folders
+            const shown = new Uint8Array(folders.length);
+            for (const i of visibleRows) {{
+                for (const f of rowFolders[i]) {{
+                    if (shown[f]) break;   // Its outer folders were marked along with it
+                    shown[f] = 1;
+                }}
             }}
-
-            for (const folder of [...folders].reverse()) {{
-                const hasVisibleRow = folder.querySelector('tr.entry-row:not(.hidden)');
-                const hasVisibleChild = folder.querySelector('details.folder:not(.hidden)');
-                if (hasVisibleRow || hasVisibleChild) {{
-                    folder.classList.remove('hidden');
-                    if (query) {{
-                        folder.open = true;
-                    }}
+            for (let i = 0; i < folders.length; i++) {{
+                const folder = folders[i];
+                const visible = shown[i] === 1;
+                setHit(folder, folderHit, i, visible);
+                if (visible && query && !folder.open) {{
+                    folder.open = true;
                 }}
             }}
         }}
 
         function applyFilter() {{
             const query = searchBox.value.trim().toLowerCase();
-            
-            for (const row of rows) {{
+
+            // A longer query can only narrow the matches, so the rows hidden last time stay hidden
+            const candidates = query && lastQuery && query.startsWith(lastQuery) ? matchedRowIndices : allRowIndices;
+            const matched = [];
+
+            for (const i of candidates) {{
+                const row = rows[i];
                 // 1. Clean up previous highlights first
-                clearHighlights(row);
+                if (rowMarks[i]) {{
+                    clearHighlights(rowMarks[i]);
+                    rowMarks[i] = null;
+                }}
+                rowPendingQuery[i] = null;
 
                 // 2. Check visibility - even the hidden full text is searched
-                const text = (row.textContent + " " + (row.dataset.prompt || "")).toLowerCase();
-                
-                if (!query || text.includes(query)) {{
-                    row.classList.remove('hidden');
-                    // 3. Apply new highlights if query exists
+                if (!query || haystacks[i].includes(query)) {{
+                    matched.push(i);
+                    setHit(row, rowHit, i, true);
+                    // 3. Apply new highlights if query exists; off-screen rows are highlighted once they scroll into view
                     if (query) {{
-                        highlightText(row, query);
+                        if (rowOnScreen[i]) {{
+                            rowMarks[i] = highlightText(row, query);
+                        }} else {{
+                            rowPendingQuery[i] = query;
+                        }}
                     }}
                 }} else {{
-                    row.classList.add('hidden');
+                    setHit(row, rowHit, i, false);
                 }}
             }}
-            
-            updateFolderVisibility(query);
-            const hasVisibleRows = document.querySelector('tr.entry-row:not(.hidden)');
-            if (hasVisibleRows) {{
-                noResults.classList.remove('visible');
-            }} else {{
-                noResults.classList.add('visible');
-            }}
+            matchedRowIndices = matched;
+            lastQuery = query;
+
+            updateFolderVisibility(query, matched);
+            // Rows outside the candidates were hidden already, so the matches are all visible rows
+            noResults.classList.toggle('visible', matched.length === 0);
         }}
 
-        searchBox.addEventListener('input', applyFilter);
+        // Coalesce fast typing: at most one filter pass per animation frame
+        let pendingFilter = 0;
+        searchBox.addEventListener('input', () => {{
+            if (pendingFilter) cancelAnimationFrame(pendingFilter);
+            pendingFilter = requestAnimationFrame(() => {{
+                pendingFilter = 0;
+                applyFilter();
+            }});
+        }});
     </script>
 </body>
 </html>
 """
+OVERVIEW_HTML_PREFIX, OVERVIEW_HTML_SUFFIX = OVERVIEW_HTML_TEMPLATE.split(HEADER_SLOT_MARKER)
+
+
+def _build_index_html_parts(entries: List[Dict[str, Any]]) -> List[str]:
+    """Generate the HTML overview page for all sessions as a list of fragments.
+
+    The fragments are meant for writelines(), so the page is never joined
+    into one string.
+    """
+    parts: List[str] = [OVERVIEW_HTML_PREFIX]
+    if not entries:
+        parts.append("<p>No converted sessions found.</p>")
+    else:
+        tree = _build_index_tree(entries)
+        _render_entries_table(tree["items"], parts)
+        _render_folder_sections(tree, parts)
+    parts.append(OVERVIEW_HTML_SUFFIX)
+    return parts
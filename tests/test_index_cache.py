@@ -0,0 +1,58 @@
+"""Tests for the overview metadata cache stored next to the overview page.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convertor_html_main import INDEX_CACHE_FILENAME, _load_index_cache, _save_index_cache
+
+
+class IndexCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self._tmp.name, INDEX_CACHE_FILENAME)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        cache = {
+            "2025/a.jsonl": ((1700000000123456789, 42), ("2025-01-02 03:04", datetime(2025, 1, 2, 3, 4, 5, 600000), "Fix the bug")),
+            "b.jsonl": ((1, 0), ("Unknown Date", None, "No prompt found")),
+        }
+        _save_index_cache(self.cache_path, cache)
+        self.assertEqual(_load_index_cache(self.cache_path), cache)
+
+    def test_cache_is_plain_json(self):
+        _save_index_cache(self.cache_path, {"a.jsonl": ((5, 6), ("d", datetime(2025, 1, 2), "p"))})
+        with open(self.cache_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"a.jsonl": [[5, 6], ["d", "2025-01-02T00:00:00", "p"]]})
+
+    def test_missing_or_corrupt_cache_is_empty(self):
+        self.assertEqual(_load_index_cache(self.cache_path), {})
+        with open(self.cache_path, "wb") as f:
+            f.write(b"\x80\x04not json")
+        self.assertEqual(_load_index_cache(self.cache_path), {})
+
+    def test_malformed_entries_are_dropped(self):
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "ok.jsonl": [[1, 2], ["d", None, "p"]],
+                "short.jsonl": [[1, 2]],
+                "bad_size.jsonl": [[1, "2"], ["d", None, "p"]],
+                "bad_time.jsonl": [[1, 2], ["d", "yesterday", "p"]],
+            }, f)
+        self.assertEqual(_load_index_cache(self.cache_path), {"ok.jsonl": ((1, 2), ("d", None, "p"))})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for JSONL line parsing in convertor_html_main.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convertor_html_main import _parse_json_line, format_timestamp
+
+
+def _strict_loads(line):
+    """Stand-in for orjson.loads, which rejects input that json.loads accepts."""
+    if b"NaN" in line or b"\\ud800" in line:
+        raise ValueError("rejected by strict parser")
+    return dict(json.loads(line), strict=True)
+
+
+class ParseJsonLineTests(unittest.TestCase):
+
+    def test_strict_parser_result_is_used(self):
+        self.assertEqual(_parse_json_line(b'{"a": 1}', _loads=_strict_loads), {"a": 1, "strict": True})
+
+    def test_nan_falls_back_to_json(self):
+        data = _parse_json_line(b'{"a": NaN}', _loads=_strict_loads)
+        self.assertTrue(math.isnan(data["a"]))
+
+    def test_lone_surrogate_falls_back_to_json(self):
+        self.assertEqual(_parse_json_line(b'{"t": "\\ud800"}', _loads=_strict_loads), {"t": "\ud800"})
+
+    def test_invalid_line_is_none(self):
+        self.assertIsNone(_parse_json_line(b'{"a": ', _loads=_strict_loads))
+        self.assertIsNone(_parse_json_line('{"a": '))
+
+    def test_deeply_nested_line_is_none(self):
+        self.assertIsNone(_parse_json_line(b"[" * 100000))
+        self.assertIsNone(_parse_json_line(b"[" * 100000, _loads=_strict_loads))
+
+
+class FormatTimestampTests(unittest.TestCase):
+
+    def test_valid_timestamps(self):
+        self.assertEqual(format_timestamp("2025-01-05T08:09:10.123Z"), "05.01.2025 08:09:10")
+        self.assertEqual(format_timestamp("2024-02-29T23:59:59Z"), "29.02.2024 23:59:59")
+
+    def test_out_of_range_fields_keep_the_raw_string(self):
+        for raw in ("2025-13-45T27:99:99Z", "2025-02-29T00:00:00Z", "2025-04-31T00:00:00", "2025-01-01T24:00:00Z"):
+            with self.subTest(raw=raw):
+                self.assertEqual(format_timestamp(raw), raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Regression tests for convertor_html_rendering.
+
+Expected strings are the output of the original multi-pass renderer, with
+only the header closing tags corrected. fixtures/format_content_corpus.json
+holds hand-written and randomly generated markdown inputs with that output.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convertor_html_rendering import format_content
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class FormatContentFenceTests(unittest.TestCase):
+    """Fenced code blocks win over inline code, headers and bold text."""
+
+    def test_stray_backtick_before_fence(self):
+        self.assertEqual(
+            format_content("Press the ` key, then:\n```py\nx = 1\n```\n"),
+            'Press the ` key, then:\n<pre><code class="language-py">x = 1\n</code></pre>\n',
+        )
+
+    def test_fence_inside_header(self):
+        self.assertEqual(
+            format_content("## Step 1: ```make```"),
+            '<h2>Step 1: <pre><code class="language-make"></code></pre></h2>',
+        )
+
+    def test_fence_inside_bold(self):
+        self.assertEqual(
+            format_content("**Run ```ls -la``` first**"),
+            '<strong>Run <pre><code class="language-ls"> -la</code></pre> first</strong>',
+        )
+
+    def test_placeholder_text_inside_fence_is_kept(self):
+        self.assertEqual(
+            format_content("```\n__CODE_BLOCK_1__\n```\n```sh\nls\n```"),
+            '<pre><code class="language-text">__CODE_BLOCK_1__\n</code></pre>\n'
+            '<pre><code class="language-sh">ls\n</code></pre>',
+        )
+
+
+class FormatContentCorpusTests(unittest.TestCase):
+    """Every corpus input renders exactly as the original renderer did."""
+
+    def test_corpus(self):
+        with open(os.path.join(FIXTURES_DIR, "format_content_corpus.json"), encoding="utf-8") as f:
+            cases = json.load(f)
+        for case in cases:
+            with self.subTest(text=case["input"]):
+                self.assertEqual(format_content.__wrapped__(case["input"]), case["expected"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Golden-file tests for whole transcripts written by convertor_html_main.
+
+fixtures/session_unminified.html is the transcript of fixtures/session.jsonl
+as written before the embedded stylesheet and script were minified.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convertor_html_main import convert_single_file
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+EMBEDDED_BLOCK_PATTERN = re.compile(r"<style>(.*?)</style>|<script>(.*?)</script>", re.S)
+CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _split_page(page):
+    """Split a page into its markup and its normalised inline stylesheet and script.
+
+    CSS loses comments and all whitespace; the script keeps one stripped,
+    non-blank line per line, since its line breaks matter.
+    """
+    parts = []
+    pos = 0
+    for match in EMBEDDED_BLOCK_PATTERN.finditer(page):
+        parts.append(("html", page[pos:match.start()]))
+        css, js = match.groups()
+        if css is not None:
+            parts.append(("css", WHITESPACE_PATTERN.sub("", CSS_COMMENT_PATTERN.sub("", css))))
+        else:
+            parts.append(("js", [line.strip() for line in js.splitlines() if line.strip()]))
+        pos = match.end()
+    parts.append(("html", page[pos:]))
+    return parts
+
+
+class MinifiedTranscriptTests(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        success, message = convert_single_file(
+            os.path.join(FIXTURES_DIR, "session.jsonl"), self._tmp.name, FIXTURES_DIR, force=True, write_index=False
+        )
+        self.assertEqual((success, message), (True, "Done"))
+        with open(os.path.join(self._tmp.name, "converted_sessions", "session.html"), encoding="utf-8") as f:
+            self.page = f.read()
+        with open(os.path.join(FIXTURES_DIR, "session_unminified.html"), encoding="utf-8") as f:
+            self.golden = f.read()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_only_whitespace_and_comments_change(self):
+        parts = _split_page(self.page)
+        self.assertEqual([kind for kind, _ in parts], ["html", "css", "html", "js", "html"])
+        self.assertEqual(parts, _split_page(self.golden))
+
+    def test_output_is_smaller(self):
+        self.assertLess(len(self.page), len(self.golden))
+
+
+class ConvertSingleFileTests(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self._tmp.name, "log.jsonl")
+        self.output_path = os.path.join(self._tmp.name, "converted_sessions", "log.html")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_log_without_messages_keeps_existing_transcript(self):
+        os.makedirs(os.path.dirname(self.output_path))
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            f.write("previous transcript")
+        with open(self.input_path, "w", encoding="utf-8") as f:
+            f.write('{"type": "session_meta", "payload": {}}\n{broken json\n')
+
+        result = convert_single_file(self.input_path, self._tmp.name, self._tmp.name, force=True, write_index=False)
+
+        self.assertEqual(result, (False, "Empty/Invalid Log"))
+        with open(self.output_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "previous transcript")
+        self.assertFalse(os.path.exists(self.output_path + ".tmp"))
+
+    def test_failing_record_becomes_error_block(self):
+        records = [
+            {"timestamp": "2025-01-05T08:00:00Z", "type": "event_msg", "payload": {"type": "user_message", "message": "hi"}},
+            # Too deeply nested for the JSON decoder: rendering the arguments raises RecursionError
+            {"type": "response_item", "payload": {"type": "function_call", "name": "x", "arguments": "[" * 100000}},
+        ]
+        with open(self.input_path, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+
+        result = convert_single_file(self.input_path, self._tmp.name, self._tmp.name, force=True, write_index=False)
+
+        self.assertEqual(result, (True, "Done"))
+        with open(self.output_path, encoding="utf-8") as f:
+            self.assertIn("Conversion Error", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()